@@ -10,6 +10,7 @@ from frappe.utils import get_files_path, cint
 from frappe.utils.file_manager import save_file
 from frappe.utils import nowdate, nowtime, get_first_day, getdate
 from frappe.auth import LoginManager
+from fds_app.utils.reference import get_reference
 
 def log_error(title, error):
     frappe.log_error(frappe.get_traceback(), title)
@@ -25,7 +26,7 @@ def flatten(lis):
 @frappe.whitelist(allow_guest=True)
 def get_regions(**kwargs):
     try:
-        regions = frappe.get_all("Region", filters={"disable": 0}, fields=["*"])
+        regions = frappe.get_all("Region", filters={"disable": 0}, fields=["*"])  # query-index: ok
 
         data = []
         for r in regions:
@@ -268,7 +269,7 @@ def get_customer_address(customer_id=None):
             region_en = None
             region_ar = None
             if addr.region:
-                region_doc = frappe.get_doc("Region", addr.region)
+                region_doc = get_reference("Region", addr.region)
                 region_id = int(region_doc.name) if str(region_doc.name).isdigit() else region_doc.name
                 region_en = region_doc.name_en
                 region_ar = region_doc.name_ar
@@ -277,7 +278,7 @@ def get_customer_address(customer_id=None):
             state_en = None
             state_ar = None
             if addr.state:
-                state_doc = frappe.get_doc("State", addr.state)
+                state_doc = get_reference("State", addr.state)
                 state_id = int(state_doc.name) if str(state_doc.name).isdigit() else state_doc.name
                 state_en = state_doc.name_en
                 state_ar = state_doc.name_ar
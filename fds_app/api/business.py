@@ -10,6 +10,10 @@ from frappe.utils import get_files_path, cint
 from frappe.utils.file_manager import save_file
 from frappe.utils import nowdate, nowtime, get_first_day, getdate
 from frappe.auth import LoginManager
+from fds_app.fds_app.doctype.item_search_index.item_search_index import search_item_index
+from fds_app.utils.categories import get_subtree
+from fds_app.utils.idempotency import idempotent
+from fds_app.utils.pagination import get_date_filter, get_page, is_paged
 
 def log_error(title, error):
     frappe.log_error(frappe.get_traceback(), title)
@@ -234,7 +238,7 @@ def update_business_profile(
         frappe.response["data"] = None
 
 @frappe.whitelist(allow_guest=True)
-def get_business_items(category_id=None, search=None):
+def get_business_items(category_id=None, search=None, limit=None, cursor=None):
     try:
         if not category_id:
             frappe.response["status"] = False
@@ -244,32 +248,34 @@ def get_business_items(category_id=None, search=None):
 
         base_url = frappe.utils.get_url()
 
-        child_groups = frappe.get_all(
-            "Item Group",
-            filters={"parent_item_group": category_id},
-            fields=["name"]
-        )
-
-        group_names = [g.name for g in child_groups] if child_groups else [category_id]
+        group_names = get_subtree(category_id)
 
         filters = {
             "disabled": 0,
             "item_group": ["in", group_names]
         }
 
-        or_filters = None
         if search:
-            or_filters = [
-                ["item_name", "like", f"%{search}%"],
-                ["custom_item_name_ar", "like", f"%{search}%"]
-            ]
-
-        items = frappe.get_all(
-            "Item",
-            filters=filters,
-            or_filters=or_filters,
-            fields=["name", "item_name", "custom_item_name_ar", "item_group", "image"]
-        )
+            matches = search_item_index(search, item_groups=group_names)[0]
+            filters["name"] = ["in", matches]
+
+        item_fields = ["name", "item_name", "custom_item_name_ar", "item_group", "image"]
+
+        next_cursor = None
+        if is_paged(limit, cursor):
+            items, next_cursor = get_page(
+                "Item",
+                filters=filters,
+                fields=item_fields,
+                limit=limit,
+                cursor=cursor
+            )
+        else:
+            items = frappe.get_all(
+                "Item",
+                filters=filters,
+                fields=item_fields
+            )
 
         item_list = []
         for item in items:
@@ -293,6 +299,8 @@ def get_business_items(category_id=None, search=None):
         frappe.response["status"] = True
         frappe.response["message"] = "Items fetched successfully"
         frappe.response["data"] = item_list
+        if is_paged(limit, cursor):
+            frappe.response["next_cursor"] = next_cursor
 
     except Exception as e:
         frappe.log_error(frappe.get_traceback(), "Get Business Items Error")
@@ -301,6 +309,7 @@ def get_business_items(category_id=None, search=None):
         frappe.response["data"] = []
 
 @frappe.whitelist(allow_guest=True, methods=["POST"])
+@idempotent("create_business_order", "customer_id")
 def create_business_order(customer_id=None, delivery_date=None, items=None):
     try:
         if not customer_id or not items or not delivery_date:
@@ -418,7 +427,7 @@ def _build_business_order_response(order_doc):
     }
 
 @frappe.whitelist(allow_guest=True)
-def get_customer_business_orders(customer_id=None):
+def get_customer_business_orders(customer_id=None, from_date=None, to_date=None, limit=None, cursor=None):
     try:
         if not customer_id:
             frappe.response["status"] = False
@@ -432,12 +441,21 @@ def get_customer_business_orders(customer_id=None):
             frappe.response["data"] = []
             return
 
-        orders = frappe.get_all(
-            "Sales Order",
-            filters={"customer": customer_id, "docstatus": 1},
-            fields=["name"],
-            order_by="creation desc"
-        )
+        filters = {"customer": customer_id, "docstatus": 1}
+        date_filter = get_date_filter(from_date, to_date)
+        if date_filter:
+            filters["transaction_date"] = date_filter
+
+        next_cursor = None
+        if is_paged(limit, cursor):
+            orders, next_cursor = get_page("Sales Order", filters=filters, limit=limit, cursor=cursor, sort_field="creation")
+        else:
+            orders = frappe.get_all(
+                "Sales Order",
+                filters=filters,
+                fields=["name"],
+                order_by="creation desc"
+            )
 
         order_list = [
             _build_business_order_response(frappe.get_doc("Sales Order", o.name))
@@ -447,6 +465,8 @@ def get_customer_business_orders(customer_id=None):
         frappe.response["status"] = True
         frappe.response["message"] = "Orders fetched successfully"
         frappe.response["data"] = order_list
+        if is_paged(limit, cursor):
+            frappe.response["next_cursor"] = next_cursor
 
     except Exception as e:
         frappe.log_error(frappe.get_traceback(), "Get Business Orders Error")
@@ -10,6 +10,8 @@ from frappe.utils import get_files_path, cint
 from frappe.utils.file_manager import save_file
 from frappe.utils import nowdate, nowtime, get_first_day, getdate
 from frappe.auth import LoginManager
+from fds_app.utils.idempotency import idempotent
+from fds_app.utils.reference import get_variation_and_unit
 
 def log_error(title, error):
     frappe.log_error(frappe.get_traceback(), title)
@@ -40,13 +42,11 @@ def _build_cart_data(cart_doc, base_url):
     unit_name_ar = None
 
     if cart_doc.variation:
-        variation_doc = frappe.get_doc("Variations", cart_doc.variation)
+        variation_doc, unit_doc = get_variation_and_unit(cart_doc.variation)
         variation_name_en = variation_doc.name_en
         variation_name_ar = variation_doc.name_ar
-        if variation_doc.unit:
-            unit_doc = frappe.get_doc("Units", variation_doc.unit)
-            unit_name_en = unit_doc.name_en
-            unit_name_ar = unit_doc.name_ar
+        unit_name_en = unit_doc.name_en
+        unit_name_ar = unit_doc.name_ar
 
     return {
         "id": int(cart_doc.name),
@@ -73,6 +73,7 @@ def _build_cart_data(cart_doc, base_url):
 
 
 @frappe.whitelist(allow_guest=True)
+@idempotent("add_to_cart", "customer_id")
 def add_to_cart(customer_id=None, service_id=None, variation_id=None, qty=None, time_from=None, time_to=None, is_service=0):
     try:
         if not customer_id or not service_id or not qty:
@@ -10,6 +10,8 @@ from frappe.utils import get_files_path, cint
 from frappe.utils.file_manager import save_file
 from frappe.utils import nowdate, nowtime, get_first_day, getdate
 from frappe.auth import LoginManager
+from fds_app.utils.categories import get_child_categories
+from fds_app.utils.home import get_home_payload, make_home_response
 
 def log_error(title, error):
     frappe.log_error(frappe.get_traceback(), title)
@@ -25,50 +27,7 @@ def flatten(lis):
 @frappe.whitelist(allow_guest=True)
 def get_home_data():
     try:
-        base_url = frappe.utils.get_url()
-
-        categories = frappe.get_all(
-            "Item Group",
-            filters={"is_group": 1},
-            fields=["name", "custom_name_ar", "image"],
-            order_by="name asc"
-        )
-
-        category_list = []
-        for c in categories:
-            category_list.append({
-                "id": c.name,
-                "name_en": c.name,
-                "name_ar": c.custom_name_ar,
-                "image":  base_url + c.image if c.image else None
-            })
-
-        sliders = frappe.get_all(
-            "Sliders",
-            fields=["name", "name1", "image", "url" , "message"],
-            order_by="modified desc"
-        )
-
-        slider_list = []
-        for s in sliders:
-            image_url = None
-            if s.image:
-                image_url = base_url + s.image
-
-            slider_list.append({
-                "id": s.name,
-                "name": s.name1,
-                "image": image_url,
-                "url": s.url,
-                "message": s.message
-            })
-
-        frappe.response["status"] = True
-        frappe.response["message"] = "Home data fetched successfully"
-        frappe.response["data"] = {
-            "categories": category_list,
-            "sliders": slider_list
-        }
+        return make_home_response(get_home_payload(frappe.utils.get_url()))
 
     except Exception as e:
         frappe.log_error(frappe.get_traceback(), "Home API Error")
@@ -82,28 +41,19 @@ def get_categories(category_id=None):
         base_url = frappe.utils.get_url()
 
         if category_id:
-            categories = frappe.get_all(
-                "Item Group",
-                filters={"parent_item_group": category_id, "is_group": 0},
-                fields=["name", "custom_name_ar", "image", "parent_item_group"],
-                order_by="name asc"
-            )
+            categories = get_child_categories(category_id, is_group=0)
         else:
-            categories = frappe.get_all(
-                "Item Group",
-                filters={"is_group": 1},
-                fields=["name", "custom_name_ar", "image"],
-                order_by="name asc"
-            )
+            categories = get_child_categories(is_group=1)
 
         category_list = []
         for c in categories:
             category_list.append({
                 "id": c.name,
                 "name_en": c.name,
-                "name_ar": c.custom_name_ar,
+                "name_ar": c.name_ar,
                 "image":  base_url + c.image if c.image else None,
-                "parent_id": c.parent_item_group if c.parent_item_group else None
+                "parent_id": c.parent if category_id and c.parent else None,
+                "item_count": c.item_count
             })
 
         frappe.response["status"] = True
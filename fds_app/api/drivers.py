@@ -10,6 +10,10 @@ from frappe.utils import get_files_path
 from frappe.utils.file_manager import save_file
 from frappe.utils import nowdate, nowtime, get_first_day, getdate
 from frappe.auth import LoginManager
+from fds_app.utils.idempotency import idempotent
+from fds_app.utils.orders import build_order_views, get_order_context, get_order_review
+from fds_app.utils.pagination import get_date_filter, get_page, is_paged
+from fds_app.utils.reference import get_reference
 
 def log_error(title, error):
     frappe.log_error(frappe.get_traceback(), title)
@@ -125,39 +129,6 @@ def get_driver(id=None):
         frappe.response["message"] = f"Server Error: {str(e)}"
         frappe.response["data"] = {}
 
-def _get_customer_review(customer_id, product_id):
-    review = frappe.db.get_value(
-        "Reviews",
-        {"service": product_id, "customer": customer_id},
-        ["name", "stars", "review", "creation"],
-        as_dict=True
-    )
-
-    if not review:
-        return None
-
-    likes_count = frappe.db.count("Customers Table", {
-        "parent": review.name, "parenttype": "Reviews", "parentfield": "liked_by"
-    })
-    dislikes_count = frappe.db.count("Customers Table", {
-        "parent": review.name, "parenttype": "Reviews", "parentfield": "disliked_by"
-    })
-
-    return {
-        "id": int(review.name),
-        "product_id": product_id,
-        "user_id": customer_id,
-        "rating": review.stars,
-        "review_likes": likes_count,
-        "review_dislikes": dislikes_count,
-        "is_user_like": 0,
-        "is_user_dislike": 0,
-        "review_msg": review.review,
-        "user_name": frappe.db.get_value("Customer", customer_id, "customer_name"),
-        "created_at": str(review.creation)
-    }
-
-
 def _get_driver_from_user(user_id):
     driver_name = frappe.db.get_value("Drivers", {"user": user_id}, "name")
     if not driver_name:
@@ -165,28 +136,29 @@ def _get_driver_from_user(user_id):
     return driver_name
 
 
-def _build_order_response(order_doc, base_url):
+def _build_order_response(order_doc, base_url, context=None):
+    context = context or get_order_context([order_doc])
+
     address_line = ""
     state_name = ""
     region_name = ""
     lat_lng = ""
 
-    if order_doc.address:
-        address_doc = frappe.get_doc("Customer Address", order_doc.address)
+    address_doc = context.addresses.get(str(order_doc.address)) if order_doc.address else None
+    if address_doc:
         address_line = address_doc.address or ""
         lat_lng = address_doc.lat_lng or ""
         if address_doc.state:
-            state_name = frappe.db.get_value("State", address_doc.state, "name_en") or ""
+            state_name = get_reference("State", address_doc.state).name_en or ""
         if address_doc.region:
-            region_name = frappe.db.get_value("Region", address_doc.region, "name_en") or ""
+            region_name = get_reference("Region", address_doc.region).name_en or ""
 
     driver_name = ""
     driver_contact = ""
-    if order_doc.driver:
-        driver_doc = frappe.get_doc("Drivers", order_doc.driver)
+    driver_doc = context.drivers.get(str(order_doc.driver)) if order_doc.driver else None
+    if driver_doc:
         driver_name = driver_doc.driver_name or ""
-        if driver_doc.user:
-            driver_contact = frappe.db.get_value("User", driver_doc.user, "mobile_no") or ""
+        driver_contact = context.driver_contacts.get(str(order_doc.driver)) or ""
 
     product_details = []
 
@@ -198,14 +170,14 @@ def _build_order_response(order_doc, base_url):
         variation_name_en = ""
         variation_name_ar = ""
 
-        if order_doc.service:
-            item_doc = frappe.get_doc("Item", order_doc.service)
+        item_doc = context.items.get(order_doc.service) if order_doc.service else None
+        if item_doc:
             service_name = item_doc.item_name or ""
             service_name_ar = item_doc.custom_item_name_ar or ""
             service_image = base_url + item_doc.image if item_doc.image else ""
 
         if order_doc.variation:
-            variation_doc = frappe.get_doc("Variations", order_doc.variation)
+            variation_doc = get_reference("Variations", order_doc.variation)
             variation_id = variation_doc.name or ""
             variation_name_en = variation_doc.name_en or ""
             variation_name_ar = variation_doc.name_ar or ""
@@ -222,11 +194,11 @@ def _build_order_response(order_doc, base_url):
             "variation_name_en": variation_name_en,
             "variation_name_ar": variation_name_ar,
             "time_slot": order_doc.data_lnrd or "",
-            "product_review": _get_customer_review(order_doc.customer, order_doc.service) if order_doc.service else None,
+            "product_review": get_order_review(context, order_doc.customer, order_doc.service) if order_doc.service else None,
         })
     else:
         for row in (order_doc.services or []):
-            item_doc = frappe.get_doc("Item", row.item_code)
+            item_doc = context.items.get(row.item_code) or frappe._dict()
             product_details.append({
                 "product_id": row.item_code or "",
                 "product_name": row.item_name or "",
@@ -239,7 +211,7 @@ def _build_order_response(order_doc, base_url):
                 "variation_name_en": "",
                 "variation_name_ar": "",
                 "time_slot": "",
-                "product_review": _get_customer_review(order_doc.customer, row.item_code),
+                "product_review": get_order_review(context, order_doc.customer, row.item_code),
             })
 
     return {
@@ -274,7 +246,7 @@ def _get_status_filter(status):
     return ["in", status_list] if len(status_list) > 1 else status_list[0]
 
 @frappe.whitelist(allow_guest=True)
-def get_orders(user_id=None, status=None):
+def get_orders(user_id=None, status=None, from_date=None, to_date=None, limit=None, cursor=None):
     try:
         if not user_id:
             frappe.response["status"] = False
@@ -294,21 +266,27 @@ def get_orders(user_id=None, status=None):
         if status_filter:
             filters["status"] = status_filter
 
-        orders = frappe.get_all(
-            "Order",
-            filters=filters,
-            fields=["name"],
-            order_by="creation desc"
-        )
-
-        base_url = frappe.utils.get_url()
+        date_filter = get_date_filter(from_date, to_date)
+        if date_filter:
+            filters["order_date"] = date_filter
+
+        next_cursor = None
+        if is_paged(limit, cursor):
+            rows, next_cursor = get_page("Order", filters=filters, limit=limit, cursor=cursor, sort_field="creation")
+            orders = [r.name for r in rows]
+        else:
+            orders = frappe.get_all(
+                "Order",
+                filters=filters,
+                pluck="name",
+                order_by="creation desc"
+            )
 
         frappe.response["status"] = True
         frappe.response["message"] = "Orders fetched successfully"
-        frappe.response["data"] = [
-            _build_order_response(frappe.get_doc("Order", o.name), base_url)
-            for o in orders
-        ]
+        frappe.response["data"] = build_order_views(orders, _build_order_response)
+        if is_paged(limit, cursor):
+            frappe.response["next_cursor"] = next_cursor
 
     except Exception as e:
         frappe.log_error(frappe.get_traceback(), "Driver Get Orders Error")
@@ -512,6 +490,7 @@ def get_staff():
         frappe.response["data"] = []
 
 @frappe.whitelist(allow_guest=True)
+@idempotent("create_driver_log", "driver_id")
 def create_driver_log():
     try:
         raw_data = frappe.request.data
@@ -10,7 +10,14 @@ from frappe.utils import get_files_path, cint
 from frappe.utils.file_manager import save_file
 from frappe.utils import nowdate, nowtime, get_first_day, getdate
 from frappe.auth import LoginManager
+from fds_app.utils.holidays import is_holiday
+from fds_app.utils.idempotency import idempotent
+from fds_app.utils.orders import build_order_views, get_order_context, get_order_review
+from fds_app.utils.pagination import get_date_filter, get_page, is_paged
+from fds_app.utils.reference import get_reference
+from fds_app.utils.slots import get_slot_availability
 from fds_app.fds_app.doctype.order.order import _slot_label_from_times
+from fds_app.fds_app.doctype.slot_capacity.slot_capacity import SlotUnavailableError
 
 def log_error(title, error):
     frappe.log_error(frappe.get_traceback(), title)
@@ -24,7 +31,7 @@ def flatten(lis):
             yield item
 
 @frappe.whitelist(allow_guest=True)
-def get_free_slots(product_id=None, receive_date=None, variation_id=None):
+def get_free_slots(product_id=None, receive_date=None, variation_id=None, to_date=None):
     try:
         if not product_id or not receive_date or not variation_id:
             frappe.response["status"] = False
@@ -32,55 +39,43 @@ def get_free_slots(product_id=None, receive_date=None, variation_id=None):
             frappe.response["available_slots"] = []
             return
 
-        item_doc = frappe.get_doc("Item", product_id)
+        holiday_list = frappe.db.get_value("Item", product_id, "custom_holiday_list")
 
-        if item_doc.custom_holiday_list:
-            holiday_doc = frappe.get_doc("Holiday List", item_doc.custom_holiday_list)
-            holiday_dates = [str(h.holiday_date) for h in (holiday_doc.holidays or [])]
-            if receive_date in holiday_dates:
-                frappe.response["status"] = False
-                frappe.response["message"] = "Selected date is a holiday, no slots available"
-                frappe.response["available_slots"] = []
-                return
+        if not to_date and is_holiday(holiday_list, receive_date):
+            frappe.response["status"] = False
+            frappe.response["message"] = "Selected date is a holiday, no slots available"
+            frappe.response["available_slots"] = []
+            return
 
-        variation_rows = [
-            row for row in (item_doc.custom_slots_and_variations_table or [])
-            if str(row.variation) == str(variation_id)
-        ]
+        availability = get_slot_availability(product_id, variation_id, receive_date, to_date, holiday_list)
 
-        if not variation_rows:
+        if not availability:
             frappe.response["status"] = False
             frappe.response["message"] = "No slots found for this variation"
             frappe.response["available_slots"] = []
             return
 
-        available_slots = []
-
-        for row in variation_rows:
-            max_per_day = row.max_per_day or 0
-            time_from = str(row.get("from")) if row.get("from") is not None else None
-            time_to = str(row.to) if row.to is not None else None
-
-            booked_count = frappe.db.count("Order", {
-                "service": product_id,
-                "variation": variation_id,
-                "data_lnrd": f"{time_from} - {time_to}",
-                "order_date": receive_date,
-                "status": ["not in", ["cancelled"]]
+        available_days = []
+        for day, slots in availability.items():
+            available_days.append({
+                "date": day,
+                "is_holiday": 1 if slots is None else 0,
+                "available_slots": [
+                    {
+                        "count": slot.remaining,
+                        "time_from": format_time(slot.time_from),
+                        "time_to": format_time(slot.time_to),
+                    }
+                    for slot in (slots or [])
+                    if slot.remaining > 0
+                ]
             })
 
-            remaining = max_per_day - booked_count
-
-            if remaining > 0:
-                available_slots.append({
-                    "count": remaining,
-                    "time_from": format_time(time_from),
-                    "time_to": format_time(time_to),
-                })
-
         frappe.response["status"] = True
         frappe.response["message"] = "Free slots fetched successfully"
-        frappe.response["available_slots"] = available_slots
+        frappe.response["available_slots"] = available_days[0]["available_slots"]
+        if to_date:
+            frappe.response["available_days"] = available_days
 
     except Exception as e:
         frappe.log_error(frappe.get_traceback(), "Get Free Slots Error")
@@ -133,7 +128,54 @@ def _build_order_data(order_doc):
     }
 
 
+def _get_order_by_idempotency_key(customer_id, idempotency_key):
+    if not idempotency_key:
+        return None
+    # a locking read sees orders committed by a concurrent retry after this transaction started
+    return frappe.db.get_value(
+        "Order", {"customer": customer_id, "idempotency_key": idempotency_key}, "name", for_update=True
+    )
+
+
+def _replay_order(order_name):
+    frappe.response["status"] = True
+    frappe.response["message"] = "Order already created"
+    frappe.response["data"] = _build_order_data(frappe.get_doc("Order", order_name))
+
+
+def _build_services_rows(cart_items):
+    items = {
+        i.name: i for i in frappe.get_all(
+            "Item",
+            filters={"name": ["in", list({c.service for c in cart_items})]},
+            fields=["name", "item_name", "stock_uom"]
+        )
+    }
+    income_account, cost_center = frappe.db.get_value(
+        "Company", frappe.defaults.get_global_default("company"), ["default_income_account", "cost_center"]
+    ) or (None, None)
+
+    return [
+        {
+            "doctype": "Sales Invoice Item",
+            "item_code": c.service,
+            "item_name": (items.get(c.service) or {}).get("item_name"),
+            "qty": c.qty,
+            "rate": c.price,
+            "amount": (c.price or 0) * (c.qty or 1),
+            "uom": (items.get(c.service) or {}).get("stock_uom") or "Nos",
+            "conversion_factor": 1,
+            "base_rate": c.price,
+            "base_amount": (c.price or 0) * (c.qty or 1),
+            "income_account": income_account or "Sales - FDS",
+            "cost_center": cost_center or "Main - FDS",
+        }
+        for c in cart_items
+    ]
+
+
 @frappe.whitelist(allow_guest=True)
+@idempotent("create_order", "customer_id")
 def create_order(
     customer_id=None,
     address_id=None,
@@ -144,6 +186,7 @@ def create_order(
     payment_status=None,
     payment_ref=None,
     order_date=None,
+    idempotency_key=None,
 ):
     try:
         if not customer_id or not address_id:
@@ -152,6 +195,8 @@ def create_order(
             frappe.response["data"] = None
             return
 
+        idempotency_key = idempotency_key or frappe.get_request_header("Idempotency-Key")
+
         address_doc = frappe.get_doc("Customer Address", address_id)
         if not address_doc.state:
             frappe.response["status"] = False
@@ -159,12 +204,19 @@ def create_order(
             frappe.response["data"] = None
             return
 
+        # lock the cart so a concurrent checkout waits for this one instead of ordering the same lines
         cart_items = frappe.get_all(
             "Carts",
             filters={"customer": customer_id},
-            fields=["name", "service", "variation", "qty", "price", "time_from", "time_to", "is_service"]
+            fields=["name", "service", "variation", "qty", "price", "time_from", "time_to", "is_service"],
+            for_update=True
         )
 
+        existing_order = _get_order_by_idempotency_key(customer_id, idempotency_key)
+        if existing_order:
+            _replay_order(existing_order)
+            return
+
         if not cart_items:
             frappe.response["status"] = False
             frappe.response["message"] = "Cart is empty"
@@ -196,6 +248,7 @@ def create_order(
             "payment_status": payment_status,
             "payment_method": payment_method,
             "payment_ref": payment_ref,
+            "idempotency_key": idempotency_key,
             "note": note,
             "driver": driver,
         }
@@ -210,77 +263,75 @@ def create_order(
                     if cart.time_from is not None and cart.time_to is not None
                     else None
                 ),
+                "slot_from": cart.time_from,
+                "slot_to": cart.time_to,
                 "service": cart.service,
             })
         else:
-            services_rows = [
-                {
-                    "doctype": "Sales Invoice Item",
-                    "item_code": c.service,
-                    "item_name": frappe.db.get_value("Item", c.service, "item_name"),
-                    "qty": c.qty,
-                    "rate": c.price,
-                    "amount": (c.price or 0) * (c.qty or 1),
-                    "uom": frappe.db.get_value("Item", c.service, "stock_uom") or "Nos",
-                    "conversion_factor": 1,
-                    "base_rate": c.price,
-                    "base_amount": (c.price or 0) * (c.qty or 1),
-                    "income_account": frappe.db.get_value(
-                        "Company", frappe.defaults.get_global_default("company"), "default_income_account"
-                    ) or "Sales - FDS",
-                    "cost_center": frappe.db.get_value(
-                        "Company", frappe.defaults.get_global_default("company"), "cost_center"
-                    ) or "Main - FDS",
-                }
-                for c in cart_items
-            ]
             order_fields.update({
                 "service_order": 0,
-                "services": services_rows,
+                "services": _build_services_rows(cart_items),
             })
 
         order = frappe.get_doc(order_fields)
         order.insert(ignore_permissions=True)
-        frappe.db.commit()
-
-        for c in cart_items:
-            frappe.delete_doc("Carts", c.name, ignore_permissions=True)
+        frappe.db.delete("Carts", {"name": ["in", [c.name for c in cart_items]]})
         frappe.db.commit()
 
         frappe.response["status"] = True
         frappe.response["message"] = "Order created successfully"
         frappe.response["data"] = _build_order_data(order)
 
+    except SlotUnavailableError as e:
+        frappe.db.rollback()
+        frappe.response["status"] = False
+        frappe.response["message"] = str(e)
+        frappe.response["data"] = None
+
+    except (frappe.DuplicateEntryError, frappe.UniqueValidationError):
+        # a retry with the same idempotency key committed first
+        frappe.db.rollback()
+        existing_order = _get_order_by_idempotency_key(customer_id, idempotency_key)
+        if not existing_order:
+            frappe.log_error(frappe.get_traceback(), "Create Order Error")
+            frappe.response["status"] = False
+            frappe.response["message"] = "Server Error: duplicate order"
+            frappe.response["data"] = None
+            return
+        _replay_order(existing_order)
+
     except Exception as e:
+        frappe.db.rollback()
         frappe.log_error(frappe.get_traceback(), "Create Order Error")
         frappe.response["status"] = False
         frappe.response["message"] = f"Server Error: {str(e)}"
         frappe.response["data"] = None
 
-def _build_order_response(order_doc, base_url):
+def _build_order_response(order_doc, base_url, context=None):
+    context = context or get_order_context([order_doc])
+
     address_line = None
     state_name = None
     region_name = None
     lat_lng = None
 
-    if order_doc.address:
-        address_doc = frappe.get_doc("Customer Address", order_doc.address)
+    address_doc = context.addresses.get(str(order_doc.address)) if order_doc.address else None
+    if address_doc:
         address_line = address_doc.address
         lat_lng = address_doc.lat_lng
         if address_doc.state:
-            state_name = frappe.db.get_value("State", address_doc.state, "name_en")
+            state_name = get_reference("State", address_doc.state).name_en
         if address_doc.region:
-            region_name = frappe.db.get_value("Region", address_doc.region, "name_en")
+            region_name = get_reference("Region", address_doc.region).name_en
 
     driver_name = None
     driver_contact = None
-    if order_doc.driver:
-        driver_doc = frappe.get_doc("Drivers", order_doc.driver)
+    driver_doc = context.drivers.get(str(order_doc.driver)) if order_doc.driver else None
+    if driver_doc:
         driver_name = driver_doc.driver_name
-        if driver_doc.user:
-            driver_contact = frappe.db.get_value("User", driver_doc.user, "mobile_no")
+        driver_contact = context.driver_contacts.get(str(order_doc.driver))
 
-    customer_user = frappe.db.get_value("Customer", order_doc.customer, "custom_user")
+    customer_user = (context.customers.get(order_doc.customer) or {}).get("custom_user")
 
     service_id = None
     service_name = None
@@ -295,22 +346,22 @@ def _build_order_response(order_doc, base_url):
     full_customer_name = order_doc.customer_first_name + " " + order_doc.customer_last_name
 
     if order_doc.service_order:
-        if order_doc.service:
-            item_doc = frappe.get_doc("Item", order_doc.service)
+        item_doc = context.items.get(order_doc.service) if order_doc.service else None
+        if item_doc:
             service_id = item_doc.name
             service_name = item_doc.item_name
             service_name_ar = item_doc.custom_item_name_ar
             service_image = base_url + item_doc.image if item_doc.image else None
-            service_review = _get_customer_review(order_doc.customer, order_doc.service)
+            service_review = get_order_review(context, order_doc.customer, order_doc.service)
             
         if order_doc.variation:
-            variation_doc = frappe.get_doc("Variations", order_doc.variation)
+            variation_doc = get_reference("Variations", order_doc.variation)
             variation_id = variation_doc.name
             variation_name_en = variation_doc.name_en
             variation_name_ar = variation_doc.name_ar
     else:
         for row in (order_doc.services or []):
-            item_doc = frappe.get_doc("Item", row.item_code)
+            item_doc = context.items.get(row.item_code) or frappe._dict()
             product_details.append({
                 "product_id": row.item_code,
                 "product_name": row.item_name,
@@ -319,7 +370,7 @@ def _build_order_response(order_doc, base_url):
                 "qty": row.qty,
                 "price": row.rate,
                 "amount": row.amount,
-                "product_review": _get_customer_review(order_doc.customer, row.item_code)
+                "product_review": get_order_review(context, order_doc.customer, row.item_code)
             })
 
     return {
@@ -385,7 +436,7 @@ def get_order_detail(order_id=None):
 
 
 @frappe.whitelist(allow_guest=True)
-def get_order_list(customer_id=None, status=None):
+def get_order_list(customer_id=None, status=None, from_date=None, to_date=None, limit=None, cursor=None):
     try:
         if not customer_id:
             frappe.response["status"] = False
@@ -401,23 +452,29 @@ def get_order_list(customer_id=None, status=None):
             else:
                 filters["status"] = status_list[0]
 
-        orders = frappe.get_all(
-            "Order",
-            filters=filters,
-            fields=["name"],
-            order_by="creation desc"
-        )
+        date_filter = get_date_filter(from_date, to_date)
+        if date_filter:
+            filters["order_date"] = date_filter
 
-        base_url = frappe.utils.get_url()
-        order_list = []
+        next_cursor = None
+        if is_paged(limit, cursor):
+            rows, next_cursor = get_page("Order", filters=filters, limit=limit, cursor=cursor, sort_field="creation")
+            orders = [r.name for r in rows]
+        else:
+            orders = frappe.get_all(
+                "Order",
+                filters=filters,
+                pluck="name",
+                order_by="creation desc"
+            )
 
-        for o in orders:
-            order_doc = frappe.get_doc("Order", o.name)
-            order_list.append(_build_order_response(order_doc, base_url))
+        order_list = build_order_views(orders, _build_order_response)
 
         frappe.response["status"] = True
         frappe.response["message"] = "Orders fetched successfully"
         frappe.response["data"] = order_list
+        if is_paged(limit, cursor):
+            frappe.response["next_cursor"] = next_cursor
 
     except Exception as e:
         frappe.log_error(frappe.get_traceback(), "Get Order List Error")
@@ -462,35 +519,3 @@ def cancel_order(id=None):
         frappe.log_error(frappe.get_traceback(), "Cancel Order Error")
         frappe.response["status"] = False
         frappe.response["message"] = f"Server Error: {str(e)}"
-
-def _get_customer_review(customer_id, product_id):
-    review = frappe.db.get_value(
-        "Reviews",
-        {"service": product_id, "customer": customer_id},
-        ["name", "stars", "review", "creation"],
-        as_dict=True
-    )
-
-    if not review:
-        return None
-
-    likes_count = frappe.db.count("Customers Table", {
-        "parent": review.name, "parenttype": "Reviews", "parentfield": "liked_by"
-    })
-    dislikes_count = frappe.db.count("Customers Table", {
-        "parent": review.name, "parenttype": "Reviews", "parentfield": "disliked_by"
-    })
-
-    return {
-        "id": int(review.name),
-        "product_id": product_id,
-        "user_id": customer_id,
-        "rating": review.stars,
-        "review_likes": likes_count,
-        "review_dislikes": dislikes_count,
-        "is_user_like": 0,
-        "is_user_dislike": 0,
-        "review_msg": review.review,
-        "user_name": frappe.db.get_value("Customer", customer_id, "customer_name"),
-        "created_at": str(review.creation)
-    }
\ No newline at end of file
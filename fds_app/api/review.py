@@ -10,6 +10,10 @@ from frappe.utils import get_files_path, cint
 from frappe.utils.file_manager import save_file
 from frappe.utils import nowdate, nowtime, get_first_day, getdate
 from frappe.auth import LoginManager
+from fds_app.fds_app.doctype.reviews.reviews import toggle_reaction
+from fds_app.utils.catalog import REVIEW_FIELDS, build_review_list
+from fds_app.utils.idempotency import idempotent
+from fds_app.utils.pagination import get_page, is_paged
 
 def log_error(title, error):
     frappe.log_error(frappe.get_traceback(), title)
@@ -23,7 +27,7 @@ def flatten(lis):
             yield item
 
 @frappe.whitelist(allow_guest=True)
-def get_review_list(item_id=None, user_id=None):
+def get_review_list(item_id=None, user_id=None, cursor=None, limit=None):
     try:
         if not item_id:
             frappe.response["status"] = False
@@ -31,52 +35,31 @@ def get_review_list(item_id=None, user_id=None):
             frappe.response["data"] = []
             return
 
-        reviews_raw = frappe.get_all(
-            "Reviews",
-            filters={"service": item_id},
-            fields=["name", "customer", "stars", "review", "creation"],
-            order_by="creation desc"
-        )
-
-        review_list = []
-        for r in reviews_raw:
-            likes_count = frappe.db.count("Customers Table", {
-                "parent": r.name, "parenttype": "Reviews", "parentfield": "liked_by"
-            })
-            dislikes_count = frappe.db.count("Customers Table", {
-                "parent": r.name, "parenttype": "Reviews", "parentfield": "disliked_by"
-            })
-
-            is_user_like = 0
-            is_user_dislike = 0
-
-            if user_id:
-                is_user_like = 1 if frappe.db.exists("Customers Table", {
-                    "parent": r.name, "parenttype": "Reviews",
-                    "parentfield": "liked_by", "customer": user_id
-                }) else 0
-                is_user_dislike = 1 if frappe.db.exists("Customers Table", {
-                    "parent": r.name, "parenttype": "Reviews",
-                    "parentfield": "disliked_by", "customer": user_id
-                }) else 0
-
-            review_list.append({
-                "id": int(r.name),
-                "product_id": item_id,
-                "user_id": r.customer,
-                "rating": r.stars,
-                "review_likes": likes_count,
-                "review_dislikes": dislikes_count,
-                "is_user_like": is_user_like,
-                "is_user_dislike": is_user_dislike,
-                "review_msg": r.review,
-                "user_name": frappe.get_value("Customer", r.customer, "customer_name"),
-                "created_at": str(r.creation)
-            })
+        next_cursor = None
+        if is_paged(limit, cursor):
+            reviews_raw, next_cursor = get_page(
+                "Reviews",
+                filters={"service": item_id},
+                fields=REVIEW_FIELDS,
+                limit=limit,
+                cursor=cursor,
+                sort_field="creation"
+            )
+        else:
+            reviews_raw = frappe.get_all(
+                "Reviews",
+                filters={"service": item_id},
+                fields=REVIEW_FIELDS,
+                order_by="creation desc"
+            )
+
+        review_list = build_review_list(reviews_raw, user_id, product_id=item_id)
 
         frappe.response["status"] = True
         frappe.response["message"] = "Reviews fetched successfully"
         frappe.response["data"] = review_list
+        if is_paged(limit, cursor):
+            frappe.response["next_cursor"] = next_cursor
 
     except Exception as e:
         frappe.log_error(frappe.get_traceback(), "Get Review List Error")
@@ -85,6 +68,7 @@ def get_review_list(item_id=None, user_id=None):
         frappe.response["data"] = []
 
 @frappe.whitelist(allow_guest=True)
+@idempotent("create_review", "customer")
 def create_review(service, customer, stars, review=None):
     try:
         if not service or not customer:
@@ -174,35 +158,14 @@ def delete_review(review_id):
 @frappe.whitelist(allow_guest=True)
 def toggle_like(review_id, customer):
     try:
-        doc = frappe.get_doc("Reviews", review_id)
-
-        already_liked = False
-
-        for row in doc.liked_by:
-            if row.customer == customer:
-                doc.remove(row)
-                already_liked = True
-                break
-
-        if already_liked:
-            action = "Like removed"
-        else:
-            for row in doc.disliked_by:
-                if row.customer == customer:
-                    doc.remove(row)
-                    break
-
-            doc.append("liked_by", {"customer": customer})
-            action = "Liked"
-
-        doc.save(ignore_permissions=True)
+        liked, counts = toggle_reaction(review_id, customer, "liked_by")
         frappe.db.commit()
 
         frappe.response["status"] = True
-        frappe.response["message"] = action
+        frappe.response["message"] = "Liked" if liked else "Like removed"
         frappe.response["data"] = {
-            "likes_count": len(doc.liked_by),
-            "dislikes_count": len(doc.disliked_by)
+            "likes_count": counts.likes_count,
+            "dislikes_count": counts.dislikes_count
         }
 
     except Exception as e:
@@ -214,35 +177,14 @@ def toggle_like(review_id, customer):
 @frappe.whitelist(allow_guest=True)
 def toggle_dislike(review_id, customer):
     try:
-        doc = frappe.get_doc("Reviews", review_id)
-
-        already_disliked = False
-
-        for row in doc.disliked_by:
-            if row.customer == customer:
-                doc.remove(row)
-                already_disliked = True
-                break
-
-        if already_disliked:
-            action = "Dislike removed"
-        else:
-            for row in doc.liked_by:
-                if row.customer == customer:
-                    doc.remove(row)
-                    break
-
-            doc.append("disliked_by", {"customer": customer})
-            action = "Disliked"
-
-        doc.save(ignore_permissions=True)
+        disliked, counts = toggle_reaction(review_id, customer, "disliked_by")
         frappe.db.commit()
 
         frappe.response["status"] = True
-        frappe.response["message"] = action
+        frappe.response["message"] = "Disliked" if disliked else "Dislike removed"
         frappe.response["data"] = {
-            "likes_count": len(doc.liked_by),
-            "dislikes_count": len(doc.disliked_by)
+            "likes_count": counts.likes_count,
+            "dislikes_count": counts.dislikes_count
         }
 
     except Exception as e:
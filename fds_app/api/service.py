@@ -10,6 +10,17 @@ from frappe.utils import get_files_path, cint
 from frappe.utils.file_manager import save_file
 from frappe.utils import nowdate, nowtime, get_first_day, getdate
 from frappe.auth import LoginManager
+from fds_app.fds_app.doctype.item_rating.item_rating import get_item_rating, get_item_ratings
+from fds_app.fds_app.doctype.item_search_index.item_search_index import search_item_index
+from fds_app.fds_app.doctype.related_items.related_items import get_related_item_names
+from fds_app.utils.catalog import ITEM_LIST_FIELDS, REVIEW_FIELDS, build_item_list, build_review_list, get_wishlist_page
+from fds_app.utils.categories import get_subtree
+from fds_app.utils.holidays import get_holiday_dates
+from fds_app.utils.pagination import get_page, get_page_length, is_paged
+from fds_app.utils.projection import get_catalog_projections
+from fds_app.utils.reference import get_reference
+from fds_app.utils.suggest import get_suggestions
+from fds_app.utils.wishlist import add_wishlist_item, get_wishlist_set, remove_wishlist_item
 
 def log_error(title, error):
     frappe.log_error(frappe.get_traceback(), title)
@@ -23,177 +34,148 @@ def flatten(lis):
             yield item
 
 @frappe.whitelist(allow_guest=True)
-def get_items(category_id=None, user_id=None, search=None):
+def get_items(
+    category_id=None,
+    user_id=None,
+    search=None,
+    limit=None,
+    cursor=None,
+    reviews_limit=None,
+    holiday_window=None,
+):
     try:
         base_url = frappe.utils.get_url()
 
-        if category_id:
-            child_groups = frappe.get_all(
-                "Item Group",
-                filters={"parent_item_group": category_id},
-                fields=["name"]
-            )
-
-            if child_groups:
-                group_names = [g.name for g in child_groups]
-            else:
-                group_names = [category_id]
-        else:
-            group_names = []
+        group_names = get_subtree(category_id) if category_id else []
 
         filters = {"disabled": 0 , "custom_is_business": 0}
 
         if group_names:
             filters["item_group"] = ["in", group_names]
     
-        or_filters = None
         if search:
-            or_filters = [
-                ["item_name", "like", f"%{search}%"],
-                ["custom_item_name_ar", "like", f"%{search}%"]
-            ]
+            matches = search_item_index(search, is_business=0, item_groups=group_names)[0]
+            filters["name"] = ["in", matches]
+
+        next_cursor = None
+        if is_paged(limit, cursor):
+            items, next_cursor = get_page(
+                "Item",
+                filters=filters,
+                fields=ITEM_LIST_FIELDS,
+                limit=limit,
+                cursor=cursor
+            )
+        else:
+            items = frappe.get_all(
+                "Item",
+                filters=filters,
+                fields=ITEM_LIST_FIELDS,
+            )
 
-        items = frappe.get_all(
-            "Item",
-            filters=filters,
-            or_filters=or_filters,
-            fields=[
-                "name", "item_name", "custom_item_name_ar",
-                "description", "custom_description_ar",
-                "brand", "custom_max_per_order", "is_stock_item",
-                "item_group", "image", "custom_holiday_list", "custom_fixed_price", "custom_is_business"
-            ],
+        item_list = build_item_list(
+            items,
+            user_id=user_id,
+            base_url=base_url,
+            reviews_limit=reviews_limit,
+            holiday_window=holiday_window
         )
 
-        item_list = []
+        frappe.response["status"] = True
+        frappe.response["message"] = "Items fetched successfully"
+        frappe.response["data"] = item_list
+        if is_paged(limit, cursor):
+            frappe.response["next_cursor"] = next_cursor
 
-        for item in items:
-            brand_name = None
-            if item.brand:
-                brand_name = frappe.db.get_value("Brand", item.brand, "brand")
+    except Exception as e:
+        frappe.log_error(frappe.get_traceback(), "Get Items By Group Error")
+        frappe.response["status"] = False
+        frappe.response["message"] = f"Server Error: {str(e)}"
+        frappe.response["data"] = []
+
+@frappe.whitelist(allow_guest=True)
+def search_items(
+    search=None,
+    category_id=None,
+    user_id=None,
+    limit=None,
+    cursor=None,
+    reviews_limit=None,
+    holiday_window=None,
+):
+    try:
+        if not search:
+            frappe.response["status"] = False
+            frappe.response["message"] = "search is required"
+            frappe.response["data"] = []
+            return
 
-            holiday_dates = []
-            if item.custom_holiday_list:
-                holiday_doc = frappe.get_doc("Holiday List", item.custom_holiday_list)
-                if hasattr(holiday_doc, "holidays") and holiday_doc.holidays:
-                    holiday_dates = [str(h.holiday_date) for h in holiday_doc.holidays]
+        base_url = frappe.utils.get_url()
 
-            reviews_raw = frappe.get_all(
-                "Reviews",
-                filters={"service": item.name},
-                fields=["name", "customer", "stars", "review", "creation"],
-                order_by="creation desc"
-            )
+        group_names = get_subtree(category_id) if category_id else []
+        matches, next_cursor = search_item_index(
+            search,
+            is_business=0,
+            item_groups=group_names,
+            limit=get_page_length(limit),
+            cursor=cursor
+        )
 
-            review_list = []
-            for r in reviews_raw:
-                likes_count = frappe.db.count("Customers Table", {
-                    "parent": r.name, "parenttype": "Reviews", "parentfield": "liked_by"
-                })
-                dislikes_count = frappe.db.count("Customers Table", {
-                    "parent": r.name, "parenttype": "Reviews", "parentfield": "disliked_by"
-                })
-
-                is_user_like = 0
-                is_user_dislike = 0
-
-                if user_id:
-                    is_user_like = 1 if frappe.db.exists("Customers Table", {
-                        "parent": r.name, "parenttype": "Reviews",
-                        "parentfield": "liked_by", "customer": user_id
-                    }) else 0
-                    is_user_dislike = 1 if frappe.db.exists("Customers Table", {
-                        "parent": r.name, "parenttype": "Reviews",
-                        "parentfield": "disliked_by", "customer": user_id
-                    }) else 0
-
-                review_list.append({
-                    "id": int(r.name),
-                    "product_id": item.name,
-                    "user_id": r.customer,
-                    "rating": r.stars,
-                    "review_likes": likes_count,
-                    "review_dislikes": dislikes_count,
-                    "is_user_like": is_user_like,
-                    "is_user_dislike": is_user_dislike,
-                    "review_msg": r.review,
-                    "user_name": frappe.get_value("Customer", r.customer, "customer_name"),
-                    "created_at": str(r.creation)
-                })
-
-            reviews = frappe.get_all("Reviews", filters={"service": item.name}, fields=["stars"])
-            rating_count = len(reviews)
-            rating = round(sum([r.stars for r in reviews]) / rating_count, 1) if rating_count > 0 else 0
-
-            is_wish_list = 0
-            if user_id:
-                is_wish_list = 1 if frappe.db.exists("Item Table", {
-                    "parent": user_id,
-                    "parenttype": "Customer",
-                    "parentfield": "custom_wishlist_items",
-                    "item": item.name
-                }) else 0
-
-            variation_data = []
-            prices = []
-            unit_name_en = None
-            unit_name_ar = None
-            item_doc = frappe.get_doc("Item", item.name)
-
-            for row in (item_doc.custom_slots_and_variations_table or []):
-                variation_doc = frappe.get_doc("Variations", row.variation)
-                unit_doc = frappe.get_doc("Units", variation_doc.unit)
-                variation_data.append({
-                    "variation_id": variation_doc.name,
-                    "variation_name_en": variation_doc.name_en,
-                    "variation_name_ar": variation_doc.name_ar,
-                    "from_time": str(row.get("from")) if row.get("from") else None,
-                    "to_time": str(row.to) if row.to else None,
-                    "max_per_day": row.max_per_day,
-                    "price": row.price
-                })
-                prices.append(row.price)
-                if not unit_name_en:
-                    unit_name_en = unit_doc.name_en
-                    unit_name_ar = unit_doc.name_ar
-
-            item_list.append({
-                "id": item.name,
-                "name_en": item.item_name,
-                "name_ar": item.custom_item_name_ar,
-                "desc_en": item.description,
-                "desc_ar": item.custom_description_ar,
-                "brand_name": brand_name,
-                "is_service": 1 if item.is_stock_item == 0 else 0,
-                "has_variation": 1 if item.is_stock_item == 0 else 0,
-                "category": item.item_group,
-                "image": base_url + item.image if item.image else None,
-                "max_purchase_qty": item.custom_max_per_order,
-                "holidays": holiday_dates,
-                "reviews": review_list,
-                "rating": rating,
-                "rating_count": rating_count,
-                "is_wish_list": is_wish_list,
-                "min_price": min(prices) if prices else 0,
-                "max_price": max(prices) if prices else 0,
-                "unit_name": unit_name_en,
-                "unit_name_ar": unit_name_ar,
-                "variation_data": variation_data,
-                "fixed_price": item.custom_fixed_price
-            })
+        items = frappe.get_all(
+            "Item",
+            filters={"name": ["in", matches], "disabled": 0},
+            fields=ITEM_LIST_FIELDS,
+        ) if matches else []
+
+        rank = {name: i for i, name in enumerate(matches)}
+        items.sort(key=lambda item: rank[item.name])
+
+        item_list = build_item_list(
+            items,
+            user_id=user_id,
+            base_url=base_url,
+            reviews_limit=reviews_limit,
+            holiday_window=holiday_window
+        )
 
         frappe.response["status"] = True
         frappe.response["message"] = "Items fetched successfully"
         frappe.response["data"] = item_list
+        frappe.response["next_cursor"] = next_cursor
 
     except Exception as e:
-        frappe.log_error(frappe.get_traceback(), "Get Items By Group Error")
+        frappe.log_error(frappe.get_traceback(), "Search Items Error")
         frappe.response["status"] = False
         frappe.response["message"] = f"Server Error: {str(e)}"
         frappe.response["data"] = []
 
 @frappe.whitelist(allow_guest=True)
-def get_item_detail(id=None, user_id=None):
+def suggest(search=None, limit=None):
+    try:
+        base_url = frappe.utils.get_url()
+
+        data = []
+        for entry_type, name, name_en, name_ar, image in get_suggestions(search, limit):
+            data.append({
+                "id": name,
+                "type": entry_type,
+                "name_en": name_en,
+                "name_ar": name_ar,
+                "image": base_url + image if image else None
+            })
+
+        frappe.response["status"] = True
+        frappe.response["message"] = "Suggestions fetched successfully"
+        frappe.response["data"] = data
+
+    except Exception as e:
+        frappe.log_error(frappe.get_traceback(), "Suggest Error")
+        frappe.response["status"] = False
+        frappe.response["message"] = f"Server Error: {str(e)}"
+        frappe.response["data"] = []
+
+@frappe.whitelist(allow_guest=True)
+def get_item_detail(id=None, user_id=None, reviews_limit=None, holiday_window=None):
     try:
         if not id:
             frappe.response["status"] = False
@@ -203,101 +185,37 @@ def get_item_detail(id=None, user_id=None):
 
         base_url = frappe.utils.get_url()
 
-        if not frappe.db.exists("Item", id):
+        item = frappe.db.get_value("Item", id, ITEM_LIST_FIELDS, as_dict=True)
+        if not item:
             frappe.response["status"] = False
             frappe.response["message"] = "Product not found"
             frappe.response["data"] = None
             return
 
-        item = frappe.get_doc("Item", id)
-
         brand_name = None
         if item.brand:
-            brand_name = frappe.db.get_value("Brand", item.brand, "brand")
-
-        holiday_dates = []
-        if item.custom_holiday_list:
-            holiday_doc = frappe.get_doc("Holiday List", item.custom_holiday_list)
-            if hasattr(holiday_doc, "holidays") and holiday_doc.holidays:
-                holiday_dates = [str(h.holiday_date) for h in holiday_doc.holidays]
-
-        reviews_raw = frappe.get_all(
-            "Reviews",
-            filters={"service": item.name},
-            fields=["name", "customer", "stars", "review", "creation"],
-            order_by="creation desc"
-        )
+            brand_name = get_reference("Brand", item.brand).brand
 
-        review_list = []
-        for r in reviews_raw:
-            likes_count = frappe.db.count("Customers Table", {
-                "parent": r.name, "parenttype": "Reviews", "parentfield": "liked_by"
-            })
-            dislikes_count = frappe.db.count("Customers Table", {
-                "parent": r.name, "parenttype": "Reviews", "parentfield": "disliked_by"
-            })
+        holiday_dates = get_holiday_dates(item.custom_holiday_list, holiday_window)
 
-            is_user_like = 0
-            is_user_dislike = 0
-
-            if user_id:
-                is_user_like = 1 if frappe.db.exists("Customers Table", {
-                    "parent": r.name, "parenttype": "Reviews",
-                    "parentfield": "liked_by", "customer": user_id
-                }) else 0
-                is_user_dislike = 1 if frappe.db.exists("Customers Table", {
-                    "parent": r.name, "parenttype": "Reviews",
-                    "parentfield": "disliked_by", "customer": user_id
-                }) else 0
-
-            review_list.append({
-                "id": int(r.name),
-                "product_id": item.name,
-                "user_id": r.customer,
-                "rating": r.stars,
-                "review_likes": likes_count,
-                "review_dislikes": dislikes_count,
-                "is_user_like": is_user_like,
-                "is_user_dislike": is_user_dislike,
-                "review_msg": r.review,
-                "user_name": frappe.get_value("Customer", r.customer, "customer_name"),
-                "created_at": str(r.creation)
-            })
+        reviews_raw = []
+        if reviews_limit is None or cint(reviews_limit) > 0:
+            reviews_raw = frappe.get_all(
+                "Reviews",
+                filters={"service": item.name},
+                fields=REVIEW_FIELDS,
+                order_by="creation desc, name desc",
+                limit=cint(reviews_limit) if reviews_limit is not None else None
+            )
 
-        reviews = frappe.get_all("Reviews", filters={"service": item.name}, fields=["stars"])
-        rating_count = len(reviews)
-        rating = round(sum([r.stars for r in reviews]) / rating_count, 1) if rating_count > 0 else 0
-
-        is_wish_list = 0
-        if user_id:
-            is_wish_list = 1 if frappe.db.exists("Item Table", {
-                "parent": user_id,
-                "parenttype": "Customer",
-                "parentfield": "custom_wishlist_items",
-                "item": item.name
-            }) else 0
-
-        variation_data = []
-        prices = []
-        unit_name_en = None
-        unit_name_ar = None
-
-        for row in (item.custom_slots_and_variations_table or []):
-            variation_doc = frappe.get_doc("Variations", row.variation)
-            unit_doc = frappe.get_doc("Units", variation_doc.unit)
-            variation_data.append({
-                "variation_id": variation_doc.name,
-                "variation_name_en": variation_doc.name_en,
-                "variation_name_ar": variation_doc.name_ar,
-                "from_time": row.get("from"),
-                "to_time": row.to,
-                "max_per_day": row.max_per_day,
-                "price": row.price
-            })
-            prices.append(row.price)
-            if not unit_name_en:
-                unit_name_en = unit_doc.name_en
-                unit_name_ar = unit_doc.name_ar
+        review_list = build_review_list(reviews_raw, user_id, product_id=item.name)
+
+        rating, rating_count = get_item_rating(item.name)
+
+        wishlist = get_wishlist_set(user_id)
+        is_wish_list = 1 if item.name in wishlist else 0
+
+        projection = get_catalog_projections([item])[item.name]
 
         product_data = {
             "id": item.name,
@@ -315,68 +233,37 @@ def get_item_detail(id=None, user_id=None):
             "reviews": review_list,
             "rating": rating,
             "rating_count": rating_count,
-            "min_price": min(prices) if prices else 0,
-            "max_price": max(prices) if prices else 0,
-            "unit_name": unit_name_en,
-            "unit_name_ar": unit_name_ar,
-            "variation_data": variation_data,
+            "min_price": projection["min_price"],
+            "max_price": projection["max_price"],
+            "unit_name": projection["unit_name_en"],
+            "unit_name_ar": projection["unit_name_ar"],
+            "variation_data": projection["variation_data"],
             "is_wish_list": is_wish_list,
             "fixed_price" : item.custom_fixed_price
         }
 
+        related_names = get_related_item_names(item.name, item.item_group)
         related_items = frappe.get_all(
             "Item",
             filters={
-                "item_group": item.item_group,
-                "disabled": 0,
-                "name": ["!=", item.name]
+                "name": ["in", related_names],
+                "disabled": 0
             },
-            fields=[
-                "name", "item_name", "custom_item_name_ar",
-                "description", "custom_description_ar",
-                "brand", "custom_max_per_order", "is_stock_item",
-                "item_group", "image", "custom_holiday_list", "custom_fixed_price"
-            ],
-            limit=5
-        )
+            fields=ITEM_LIST_FIELDS
+        ) if related_names else []
+
+        related_rank = {name: i for i, name in enumerate(related_names)}
+        related_items = sorted(related_items, key=lambda rel: related_rank[rel.name])[:5]
+
+        related_ratings = get_item_ratings([rel.name for rel in related_items])
+        related_projections = get_catalog_projections(related_items)
 
         related_list = []
         for rel in related_items:
-            rel_doc = frappe.get_doc("Item", rel.name)
-            rel_prices = []
-            rel_unit_en = None
-            rel_unit_ar = None
-            rel_variations = []
-
-            for row in (rel_doc.custom_slots_and_variations_table or []):
-                variation_doc = frappe.get_doc("Variations", row.variation)
-                unit_doc = frappe.get_doc("Units", variation_doc.unit)
-                rel_variations.append({
-                    "variation_id": variation_doc.name,
-                    "variation_name_en": variation_doc.name_en,
-                    "variation_name_ar": variation_doc.name_ar,
-                    "from_time": row.get("from"),
-                    "to_time": row.to,
-                    "max_per_day": row.max_per_day,
-                    "price": row.price
-                })
-                rel_prices.append(row.price)
-                if not rel_unit_en:
-                    rel_unit_en = unit_doc.name_en
-                    rel_unit_ar = unit_doc.name_ar
-
-            rel_reviews = frappe.get_all("Reviews", filters={"service": rel.name}, fields=["stars"])
-            rel_rating_count = len(rel_reviews)
-            rel_rating = round(sum([r.stars for r in rel_reviews]) / rel_rating_count, 1) if rel_rating_count > 0 else 0
-
-            rel_wish = 0
-            if user_id:
-                rel_wish = 1 if frappe.db.exists("Item Table", {
-                    "parent": user_id,
-                    "parenttype": "Customer",
-                    "parentfield": "custom_wishlist_items",
-                    "item": rel.name
-                }) else 0
+            rel_projection = related_projections[rel.name]
+            rel_rating, rel_rating_count = related_ratings.get(rel.name, (0, 0))
+
+            rel_wish = 1 if rel.name in wishlist else 0
 
             related_list.append({
                 "id": rel.name,
@@ -391,11 +278,11 @@ def get_item_detail(id=None, user_id=None):
                 "max_purchase_qty": rel.custom_max_per_order,
                 "rating": rel_rating,
                 "rating_count": rel_rating_count,
-                "min_price": min(rel_prices) if rel_prices else 0,
-                "max_price": max(rel_prices) if rel_prices else 0,
-                "unit_name": rel_unit_en,
-                "unit_name_ar": rel_unit_ar,
-                "variation_data": rel_variations,
+                "min_price": rel_projection["min_price"],
+                "max_price": rel_projection["max_price"],
+                "unit_name": rel_projection["unit_name_en"],
+                "unit_name_ar": rel_projection["unit_name_ar"],
+                "variation_data": rel_projection["variation_data"],
                 "is_wish_list": rel_wish,
                 "fixed_price" : rel.custom_fixed_price
             })
@@ -420,24 +307,15 @@ def add_to_wishlist(user_id=None, item_id=None):
             frappe.response["message"] = "user_id and item_id are required"
             return
 
-        already_exists = frappe.db.exists("Item Table", {
-            "parent": user_id,
-            "parenttype": "Customer",
-            "parentfield": "custom_wishlist_items",
-            "item": item_id
-        })
-
-        if already_exists:
+        if not frappe.db.exists("Customer", user_id) or not frappe.db.exists("Item", item_id):
             frappe.response["status"] = False
-            frappe.response["message"] = "Item already in wishlist"
+            frappe.response["message"] = "Customer or item not found"
             return
 
-        customer_doc = frappe.get_doc("Customer", user_id)
-        customer_doc.append("custom_wishlist_items", {"item": item_id})
-        customer_doc.save(ignore_permissions=True)
+        added = add_wishlist_item(user_id, item_id)
 
         frappe.response["status"] = True
-        frappe.response["message"] = "Item added to wishlist"
+        frappe.response["message"] = "Item added to wishlist" if added else "Item already in wishlist"
 
     except Exception as e:
         frappe.log_error(frappe.get_traceback(), "Add To Wishlist Error")
@@ -452,16 +330,10 @@ def remove_from_wishlist(user_id=None, item_id=None):
             frappe.response["message"] = "user_id and item_id are required"
             return
 
-        customer_doc = frappe.get_doc("Customer", user_id)
-
-        customer_doc.custom_wishlist_items = [
-            row for row in customer_doc.custom_wishlist_items
-            if row.item != item_id
-        ]
-        customer_doc.save(ignore_permissions=True)
+        removed = remove_wishlist_item(user_id, item_id)
 
         frappe.response["status"] = True
-        frappe.response["message"] = "Item removed from wishlist"
+        frappe.response["message"] = "Item removed from wishlist" if removed else "Item not in wishlist"
 
     except Exception as e:
         frappe.log_error(frappe.get_traceback(), "Remove From Wishlist Error")
@@ -469,7 +341,7 @@ def remove_from_wishlist(user_id=None, item_id=None):
         frappe.response["message"] = f"Server Error: {str(e)}"
 
 @frappe.whitelist(allow_guest=True)
-def get_wishlist(user_id=None):
+def get_wishlist(user_id=None, limit=None, cursor=None, holiday_window=None):
     try:
         if not user_id:
             frappe.response["status"] = False
@@ -479,84 +351,21 @@ def get_wishlist(user_id=None):
 
         base_url = frappe.utils.get_url()
 
-        wishlist_items = frappe.get_all(
-            "Item Table",
-            filters={
-                "parent": user_id,
-                "parenttype": "Customer",
-                "parentfield": "custom_wishlist_items"
-            },
-            fields=["item"]
-        )
-
-        item_list = []
+        wishlist_items, next_cursor = get_wishlist_page(user_id, limit=limit, cursor=cursor)
 
-        for wish in wishlist_items:
-            item = frappe.get_doc("Item", wish.item)
-
-            # Reviews
-            reviews = frappe.get_all(
-                "Reviews",
-                filters={"service": item.name},
-                fields=["stars"]
-            )
-            rating_count = len(reviews)
-            rating = round(sum([r.stars for r in reviews]) / rating_count, 1) if rating_count > 0 else 0
-
-            variation_data = []
-            prices = []
-            unit_name_en = None
-            unit_name_ar = None
-
-            for row in (item.custom_slots_and_variations_table or []):
-                variation_doc = frappe.get_doc("Variations", row.variation)
-                unit_doc = frappe.get_doc("Units", variation_doc.unit)
-                variation_data.append({
-                    "variation_id": variation_doc.name,
-                    "variation_name_en": variation_doc.name_en,
-                    "variation_name_ar": variation_doc.name_ar,
-                    "from_time": row.get("from"),
-                    "to_time": row.to,
-                    "max_per_day": row.max_per_day,
-                    "price": row.price
-                })
-                prices.append(row.price)
-                if not unit_name_en:
-                    unit_name_en = unit_doc.name_en
-                    unit_name_ar = unit_doc.name_ar
-
-            holiday_dates = []
-            if item.custom_holiday_list:
-                holiday_doc = frappe.get_doc("Holiday List", item.custom_holiday_list)
-                if hasattr(holiday_doc, "holidays") and holiday_doc.holidays:
-                    holiday_dates = [str(h.holiday_date) for h in holiday_doc.holidays]
-
-            item_list.append({
-                "id": item.name,
-                "name_en": item.item_name,
-                "name_ar": item.custom_item_name_ar,
-                "desc_en": item.description,
-                "desc_ar": item.custom_description_ar,
-                "is_service": 1 if item.is_stock_item == 0 else 0,
-                "has_variation": 1 if item.is_stock_item == 0 else 0,
-                "category": item.item_group,
-                "image": base_url + item.image if item.image else None,
-                "max_purchase_qty": item.custom_max_per_order,
-                "holidays": holiday_dates,
-                "rating": rating,
-                "rating_count": rating_count,
-                "min_price": min(prices) if prices else 0,
-                "max_price": max(prices) if prices else 0,
-                "unit_name": unit_name_en,
-                "unit_name_ar": unit_name_ar,
-                "variation_data": variation_data,
-                "is_wish_list": 1,
-                "fixed_price" : item.custom_fixed_price
-            })
+        item_list = build_item_list(
+            wishlist_items,
+            user_id=user_id,
+            base_url=base_url,
+            reviews_limit=0,
+            holiday_window=holiday_window
+        )
 
         frappe.response["status"] = True
         frappe.response["message"] = "Wishlist fetched successfully"
         frappe.response["data"] = item_list
+        if is_paged(limit, cursor):
+            frappe.response["next_cursor"] = next_cursor
 
     except Exception as e:
         frappe.log_error(frappe.get_traceback(), "Get Wishlist Error")
@@ -0,0 +1,50 @@
+import click
+from frappe.commands import get_site, pass_context
+
+
+@click.command("rebuild-item-ratings")
+@pass_context
+def rebuild_item_ratings(context):
+	"Recompute the Item Rating aggregates from Reviews"
+	import frappe
+
+	from fds_app.fds_app.doctype.item_rating.item_rating import rebuild_item_ratings as rebuild
+
+	site = get_site(context)
+	frappe.init(site=site)
+	frappe.connect()
+	try:
+		count = rebuild()
+		click.echo(f"Rebuilt ratings for {count} items")
+	finally:
+		frappe.destroy()
+
+
+@click.command("rebuild-search-index")
+@pass_context
+def rebuild_search_index(context):
+	"Rebuild the Item Search Index from all Items"
+	import frappe
+
+	from fds_app.fds_app.doctype.item_search_index.item_search_index import rebuild_search_index as rebuild
+
+	site = get_site(context)
+	frappe.init(site=site)
+	frappe.connect()
+	try:
+		count = rebuild()
+		click.echo(f"Indexed {count} items")
+	finally:
+		frappe.destroy()
+
+
+@click.command("check-query-indexes")
+def check_query_indexes():
+	"List API queries whose filters are not covered by a database index"
+	from fds_app.utils.indexes import report_unindexed_queries
+
+	if report_unindexed_queries():
+		raise SystemExit(1)
+
+
+commands = [rebuild_item_ratings, rebuild_search_index, check_query_indexes]
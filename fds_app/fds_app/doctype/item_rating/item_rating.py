@@ -0,0 +1,107 @@
+# Copyright (c) 2026, BodyKh and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import cint
+
+STAR_FIELDS = {i: f"stars_{i}" for i in range(1, 6)}
+
+
+def _ensure_item_rating(item):
+	if frappe.db.exists("Item Rating", item):
+		return
+	try:
+		frappe.get_doc({"doctype": "Item Rating", "item": item}).insert(ignore_permissions=True)
+	except frappe.DuplicateEntryError:
+		pass
+
+
+def apply_review(item, stars, delta):
+	if not item:
+		return
+
+	stars = cint(stars)
+	delta = cint(delta)
+	_ensure_item_rating(item)
+
+	star_field = STAR_FIELDS.get(stars)
+	star_update = f", `{star_field}` = GREATEST(`{star_field}` + %(delta)s, 0)" if star_field else ""
+
+	frappe.db.sql(
+		f"""UPDATE `tabItem Rating`
+		SET rating_count = GREATEST(rating_count + %(delta)s, 0),
+			rating_total = GREATEST(rating_total + %(total)s, 0)
+			{star_update}
+		WHERE name = %(item)s""",
+		{"item": item, "delta": delta, "total": stars * delta},
+	)
+
+
+def _rating_from_row(row):
+	rating_count = cint(row.rating_count)
+	rating = round(cint(row.rating_total) / rating_count, 1) if rating_count > 0 else 0
+	return rating, rating_count
+
+
+def get_item_rating(item):
+	row = frappe.db.get_value("Item Rating", item, ["rating_count", "rating_total"], as_dict=True)
+	return _rating_from_row(row) if row else (0, 0)
+
+
+def get_item_ratings(items):
+	items = list({i for i in items if i})
+	if not items:
+		return {}
+
+	rows = frappe.get_all(
+		"Item Rating", filters={"name": ["in", items]}, fields=["name", "rating_count", "rating_total"]
+	)
+	return {r.name: _rating_from_row(r) for r in rows}
+
+
+def delete_item_rating(doc, method=None):
+	frappe.db.delete("Item Rating", {"item": doc.name})
+
+
+def compute_item_ratings():
+	rows = frappe.db.sql(
+		"""SELECT service, stars, COUNT(*) AS total
+		FROM `tabReviews`
+		WHERE IFNULL(service, '') != ''
+		GROUP BY service, stars""",
+		as_dict=True,
+	)
+
+	aggregates = {}
+	for r in rows:
+		agg = aggregates.setdefault(r.service, {"rating_count": 0, "rating_total": 0})
+		agg["rating_count"] += r.total
+		agg["rating_total"] += cint(r.stars) * r.total
+		star_field = STAR_FIELDS.get(cint(r.stars))
+		if star_field:
+			agg[star_field] = agg.get(star_field, 0) + r.total
+
+	return aggregates
+
+
+@frappe.whitelist()
+def rebuild_item_ratings():
+	frappe.only_for("System Manager")
+
+	aggregates = compute_item_ratings()
+
+	frappe.db.delete("Item Rating")
+	for item, agg in aggregates.items():
+		if not frappe.db.exists("Item", item):
+			continue
+		doc = frappe.get_doc({"doctype": "Item Rating", "item": item})
+		doc.update(agg)
+		doc.insert(ignore_permissions=True)
+
+	frappe.db.commit()
+	return len(aggregates)
+
+
+class ItemRating(Document):
+	pass
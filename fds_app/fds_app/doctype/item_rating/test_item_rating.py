@@ -0,0 +1,97 @@
+# Copyright (c) 2026, BodyKh and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from fds_app.fds_app.doctype.item_rating.item_rating import (
+	compute_item_ratings,
+	get_item_rating,
+	rebuild_item_ratings,
+)
+from fds_app.tests.utils import make_item
+
+
+def make_review(service, stars):
+	return frappe.get_doc({"doctype": "Reviews", "service": service, "stars": stars}).insert()
+
+
+class TestItemRating(FrappeTestCase):
+	def setUp(self):
+		self.item = make_item("_Test Rating Item").name
+		self.other_item = make_item("_Test Rating Item 2").name
+		frappe.db.delete("Reviews", {"service": ["in", [self.item, self.other_item]]})
+		frappe.db.delete("Item Rating", {"item": ["in", [self.item, self.other_item]]})
+
+	def get_row(self, item):
+		return frappe.db.get_value(
+			"Item Rating",
+			item,
+			["rating_count", "rating_total", "stars_1", "stars_2", "stars_3", "stars_4", "stars_5"],
+			as_dict=True,
+		)
+
+	def test_insert_adds_review(self):
+		make_review(self.item, 4)
+		make_review(self.item, 5)
+
+		row = self.get_row(self.item)
+		self.assertEqual((row.rating_count, row.rating_total), (2, 9))
+		self.assertEqual((row.stars_4, row.stars_5), (1, 1))
+		self.assertEqual(get_item_rating(self.item), (4.5, 2))
+
+	def test_edit_moves_review(self):
+		review = make_review(self.item, 2)
+
+		review.stars = 5
+		review.save()
+		row = self.get_row(self.item)
+		self.assertEqual((row.rating_count, row.rating_total), (1, 5))
+		self.assertEqual((row.stars_2, row.stars_5), (0, 1))
+
+		review.service = self.other_item
+		review.save()
+		self.assertEqual(get_item_rating(self.item), (0, 0))
+		self.assertEqual(get_item_rating(self.other_item), (5, 1))
+
+	def test_edit_without_rating_change_keeps_aggregate(self):
+		review = make_review(self.item, 3)
+
+		review.review = "Updated text"
+		review.save()
+
+		self.assertEqual(get_item_rating(self.item), (3, 1))
+
+	def test_trash_removes_review(self):
+		make_review(self.item, 5)
+		review = make_review(self.item, 1)
+
+		review.delete()
+
+		row = self.get_row(self.item)
+		self.assertEqual((row.rating_count, row.rating_total), (1, 5))
+		self.assertEqual((row.stars_1, row.stars_5), (0, 1))
+
+	def test_rebuild_matches_incremental_aggregates(self):
+		for stars in (1, 3, 3, 5):
+			make_review(self.item, stars)
+		make_review(self.other_item, 4).delete()
+		make_review(self.other_item, 2)
+
+		incremental = {item: self.get_row(item) for item in (self.item, self.other_item)}
+
+		with patch.object(frappe.db, "commit"):
+			rebuild_item_ratings()
+
+		for item, row in incremental.items():
+			self.assertEqual(self.get_row(item), row)
+			self.assertEqual(row.rating_count, compute_item_ratings()[item]["rating_count"])
+
+	def test_rebuild_requires_system_manager(self):
+		frappe.set_user("Guest")
+		try:
+			self.assertRaises(frappe.PermissionError, rebuild_item_ratings)
+		finally:
+			frappe.set_user("Administrator")
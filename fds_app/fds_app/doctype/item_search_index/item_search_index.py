@@ -0,0 +1,198 @@
+# Copyright (c) 2026, BodyKh and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import cint
+
+from fds_app.utils.pagination import decode_cursor, encode_cursor, get_page_length
+from fds_app.utils.search import index_tokens, query_tokens
+
+INDEXED_ITEM_FIELDS = [
+	"name",
+	"item_name",
+	"custom_item_name_ar",
+	"description",
+	"custom_description_ar",
+	"item_group",
+	"custom_is_business",
+	"disabled",
+]
+
+FULLTEXT_INDEXES = {
+	"title_fulltext": "title",
+	"body_fulltext": "body",
+	"title_body_fulltext": "title, body",
+}
+
+# matches in the item names outrank matches in the descriptions
+TITLE_WEIGHT = 3
+
+# InnoDB leaves tokens shorter than innodb_ft_min_token_size and its default stopwords out of the
+# FULLTEXT index, so a required "+tv*" or "+the*" would match nothing
+MIN_TOKEN_LENGTH = 3
+STOPWORDS = frozenset(
+	"a about an are as at be by com de en for from how i in is it la of on or that the this to was "
+	"what when where who will with und www".split()
+)
+
+# LIKE fallback rows rank below every FULLTEXT match, which keeps one cursor format for both
+LIKE_SCORE = -1
+
+# unpaged callers filter Item by the matched names, so the list is capped instead of growing with the catalog
+MAX_SEARCH_RESULTS = 500
+
+
+def _get_values(item):
+	return {
+		"item_group": item.item_group,
+		"is_business": cint(item.custom_is_business),
+		"disabled": cint(item.disabled),
+		"title": " ".join(index_tokens(item.item_name, item.custom_item_name_ar)),
+		"body": " ".join(index_tokens(item.description, item.custom_description_ar)),
+	}
+
+
+def index_item(item):
+	values = _get_values(item)
+	name = frappe.db.get_value("Item Search Index", {"item": item.name})
+	if name:
+		frappe.db.set_value("Item Search Index", name, values, update_modified=False)
+		return
+
+	try:
+		frappe.get_doc({"doctype": "Item Search Index", "item": item.name, **values}).insert(
+			ignore_permissions=True
+		)
+	except frappe.DuplicateEntryError:
+		pass
+
+
+def update_search_index(doc, method=None, *args):
+	if method == "after_rename":
+		# the link is already renamed, but the record keeps the old item as its name
+		frappe.db.delete("Item Search Index", {"item": doc.name})
+	index_item(doc)
+
+
+def remove_from_search_index(doc, method=None):
+	frappe.db.delete("Item Search Index", {"item": doc.name})
+
+
+@frappe.whitelist()
+def rebuild_search_index():
+	frappe.only_for("System Manager")
+
+	items = frappe.get_all("Item", fields=INDEXED_ITEM_FIELDS)
+	frappe.db.delete("Item Search Index")
+	for item in items:
+		index_item(item)
+
+	frappe.db.commit()
+	return len(items)
+
+
+def fulltext_tokens(query):
+	return [t for t in query_tokens(query) if len(t) >= MIN_TOKEN_LENGTH and t not in STOPWORDS]
+
+
+def boolean_query(tokens):
+	# every token is required and matches as a prefix
+	return " ".join(f"+{token}*" for token in tokens)
+
+
+def _match_items(tokens, limit, is_business=None, item_groups=None, after=None):
+	values = {"query": boolean_query(tokens), "limit": limit}
+	conditions = ["MATCH(title, body) AGAINST (%(query)s IN BOOLEAN MODE)", "disabled = 0"]
+	if is_business is not None:
+		conditions.append("is_business = %(is_business)s")
+		values["is_business"] = cint(is_business)
+	if item_groups:
+		conditions.append("item_group IN %(item_groups)s")
+		values["item_groups"] = tuple(item_groups)
+
+	having = ""
+	if after:
+		having = "HAVING score < %(score)s OR (score = %(score)s AND item < %(item)s)"
+		values.update(score=after.score, item=after.name)
+
+	return frappe.db.sql(
+		f"""SELECT item AS name,
+			ROUND(({TITLE_WEIGHT} * MATCH(title) AGAINST (%(query)s IN BOOLEAN MODE)
+				+ MATCH(body) AGAINST (%(query)s IN BOOLEAN MODE)) * 1000) AS score
+		FROM `tabItem Search Index`
+		WHERE {" AND ".join(conditions)}
+		{having}
+		ORDER BY score DESC, item DESC
+		LIMIT %(limit)s""",
+		values,
+		as_dict=True,
+	)
+
+
+def _like_items(query, limit, is_business=None, item_groups=None, after=None):
+	# the substring match the endpoints used before the index existed
+	filters = {"disabled": 0}
+	if is_business is not None:
+		filters["custom_is_business"] = cint(is_business)
+	if item_groups:
+		filters["item_group"] = ["in", item_groups]
+	if after:
+		filters["name"] = ["<", after.name]
+
+	names = frappe.get_all(
+		"Item",
+		filters=filters,
+		or_filters=[
+			["item_name", "like", f"%{query}%"],
+			["custom_item_name_ar", "like", f"%{query}%"],
+		],
+		pluck="name",
+		order_by="name desc",
+		limit=limit,
+	)
+	return [frappe._dict(name=name, score=LIKE_SCORE) for name in names]
+
+
+def search_item_index(query, is_business=None, item_groups=None, limit=None, cursor=None):
+	query = str(query or "").strip()
+	if not query:
+		return [], None
+
+	page_length = get_page_length(limit) if limit is not None else None
+	after = None
+	if cursor:
+		score, name = decode_cursor(cursor)
+		after = frappe._dict(score=cint(score), name=name)
+
+	like_page = bool(after) and after.score == LIKE_SCORE
+	# one row past the page tells whether there is a next one
+	row_limit = page_length + 1 if page_length else MAX_SEARCH_RESULTS
+
+	rows = []
+	tokens = fulltext_tokens(query)
+	if tokens and not like_page:
+		rows = _match_items(tokens, row_limit, is_business, item_groups, after)
+
+	# later pages keep the source of the first one; only a first page without FULLTEXT hits falls back
+	if like_page or not (rows or after):
+		rows = _like_items(query, row_limit, is_business, item_groups, after)
+
+	next_cursor = None
+	if page_length and len(rows) > page_length:
+		rows = rows[:page_length]
+		next_cursor = encode_cursor(frappe._dict(name=rows[-1].name, score=cint(rows[-1].score)), "score")
+
+	return [r.name for r in rows], next_cursor
+
+
+def on_doctype_update():
+	for index_name, columns in FULLTEXT_INDEXES.items():
+		if not frappe.db.has_index("tabItem Search Index", index_name):
+			frappe.db.sql_ddl(
+				f"ALTER TABLE `tabItem Search Index` ADD FULLTEXT INDEX `{index_name}` ({columns})"
+			)
+
+
+class ItemSearchIndex(Document):
+	pass
@@ -0,0 +1,103 @@
+# Copyright (c) 2026, BodyKh and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from fds_app.fds_app.doctype.item_search_index.item_search_index import (
+	boolean_query,
+	fulltext_tokens,
+	search_item_index,
+)
+from fds_app.tests.utils import make_item
+
+
+class TestItemSearchIndex(FrappeTestCase):
+	def setUp(self):
+		self.tv = make_item("_Test Search TV", item_name="Smart TV 55").name
+		self.cleaner = make_item("_Test Search Cleaner", item_name="The Cleaner").name
+		self.vacuum = make_item("_Test Search Vacuum", item_name="Supervacuum").name
+		self.lamps = [make_item(f"_Test Search Lamp {i}", item_name=f"Qx Lamp {i}").name for i in range(3)]
+
+	def test_fulltext_tokens_skip_short_tokens_and_stopwords(self):
+		self.assertEqual(fulltext_tokens("tv"), [])
+		self.assertEqual(fulltext_tokens("the"), [])
+		self.assertEqual(fulltext_tokens("The smart TV"), ["smart"])
+
+	def test_boolean_query_requires_every_token_as_prefix(self):
+		self.assertEqual(boolean_query(["smart", "lamp"]), "+smart* +lamp*")
+		self.assertEqual(boolean_query(fulltext_tokens("the smart-tv lamp")), "+smart* +lamp*")
+
+	def test_two_character_query(self):
+		names = search_item_index("tv")[0]
+
+		self.assertIn(self.tv, names)
+		self.assertNotIn(self.cleaner, names)
+
+	def test_stopword_query(self):
+		names = search_item_index("the")[0]
+
+		self.assertIn(self.cleaner, names)
+		self.assertNotIn(self.tv, names)
+
+	def test_infix_query(self):
+		self.assertIn(self.vacuum, search_item_index("vacuum")[0])
+
+	def test_fallback_pages(self):
+		names, cursor = [], None
+		while True:
+			page, cursor = search_item_index("qx", limit=1, cursor=cursor)
+			names += page
+			if not cursor:
+				break
+
+		self.assertEqual(names, sorted(self.lamps, reverse=True))
+
+	def test_filters_apply_to_fallback(self):
+		self.assertEqual(search_item_index("qx", item_groups=["_Test No Such Group"])[0], [])
+		self.assertEqual(search_item_index("qx", is_business=1)[0], [])
+
+
+class TestItemSearchIndexFulltext(FrappeTestCase):
+	# InnoDB FULLTEXT only sees committed rows, so these items are committed and removed afterwards
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.title = make_item("_Test Fulltext Title", item_name="Qorvath Kettle").name
+		cls.body = make_item(
+			"_Test Fulltext Body", item_name="Steel Kettle", description="Pairs with any qorvath set"
+		).name
+		cls.other = make_item("_Test Fulltext Other", item_name="Qorvath Mug").name
+		frappe.db.commit()
+
+	@classmethod
+	def tearDownClass(cls):
+		for name in (cls.title, cls.body, cls.other):
+			frappe.delete_doc("Item", name, force=True)
+		frappe.db.commit()
+		super().tearDownClass()
+
+	def test_title_match_outranks_body_match(self):
+		names = search_item_index("qorvath")[0]
+
+		self.assertLess(names.index(self.title), names.index(self.body))
+		self.assertIn(self.other, names)
+
+	def test_every_token_is_required(self):
+		names = search_item_index("qorvath kettle")[0]
+
+		self.assertIn(self.title, names)
+		self.assertNotIn(self.other, names)
+
+	def test_prefix_match(self):
+		self.assertIn(self.title, search_item_index("qorv")[0])
+
+	def test_fulltext_pages(self):
+		names, cursor = [], None
+		while True:
+			page, cursor = search_item_index("qorvath", limit=1, cursor=cursor)
+			names += page
+			if not cursor:
+				break
+
+		self.assertEqual(names, search_item_index("qorvath")[0])
@@ -1,9 +1,15 @@
 # Copyright (c) 2026, BodyKh and contributors
 # For license information, please see license.txt
 
-# import frappe
+import frappe
 from frappe.model.document import Document
 
 
+def on_doctype_update():
+	frappe.db.add_unique(
+		"Item Table", ["parent", "parenttype", "parentfield", "item"], constraint_name="unique_parent_item"
+	)
+
+
 class ItemTable(Document):
 	pass
@@ -4,6 +4,11 @@
 import frappe
 from frappe.model.document import Document
 from frappe import _
+from frappe.utils import getdate
+
+from fds_app.fds_app.doctype.slot_capacity.slot_capacity import get_slot_key, release_slot, reserve_slot
+from fds_app.utils.reference import get_reference
+from fds_app.utils.slots import get_slot_availability, normalize_time, parse_slot_label, slot_key
 
 
 def _is_api_request():
@@ -34,7 +39,7 @@ def get_valid_drivers_for_order(service_id, address_id):
     if not address_state:
         return {"driver_names": [], "first_driver": None}
 
-    address_state_name = frappe.db.get_value("State", address_state, "name_en")
+    address_state_name = get_reference("State", address_state).name_en
     if not address_state_name:
         return {"driver_names": [], "first_driver": None}
 
@@ -61,31 +66,17 @@ def get_valid_drivers_for_order(service_id, address_id):
 
 @frappe.whitelist()
 def get_available_slots(service_id, variation_id, order_date):
-    item_doc = frappe.get_doc("Item", service_id)
-
-    available_slots = []
-    for row in (item_doc.custom_slots_and_variations_table or []):
-        if str(row.variation) != str(variation_id):
-            continue
+    availability = get_slot_availability(service_id, variation_id, order_date)
 
-        time_slot = f"{row.get('from')} - {row.to}"
-
-        booked = frappe.db.count("Order", {
-            "service": service_id,
-            "variation": variation_id,
-            "data_lnrd": time_slot,
-            "order_date": order_date,
-            "status": ["not in", ["cancelled"]]
-        })
-
-        if booked < (row.max_per_day or 0):
-            available_slots.append({
-                "label": row.time_ampm,
-                "time_slot": time_slot,
-                "price": row.price or 0
-            })
-
-    return available_slots
+    return [
+        {
+            "label": slot.label,
+            "time_slot": slot_key(slot.time_from, slot.time_to),
+            "price": slot.price
+        }
+        for slot in availability.get(str(getdate(order_date))) or []
+        if slot.remaining > 0
+    ]
 
 
 @frappe.whitelist()
@@ -132,8 +123,16 @@ def create_sales_invoice(order_id):
     return invoice.name
 
 
+def on_doctype_update():
+    # a retried checkout with the same key hits this instead of booking twice
+    frappe.db.add_unique("Order", ["customer", "idempotency_key"], constraint_name="unique_customer_idempotency_key")
+
+
 class Order(Document):
 
+    def before_validate(self):
+        self.set_slot_times()
+
     def validate(self):
         if _is_api_request():
             return
@@ -148,20 +147,65 @@ class Order(Document):
                 enqueue_after_commit=True
             )
 
+    def before_insert(self):
+        self.set_slot_times()
+        if self.status != "cancelled":
+            reserve_slot(self)
+
+    def on_update(self):
+        previous = self.get_doc_before_save()
+        if not previous:
+            return
+
+        was_booked = previous.status != "cancelled"
+        is_booked = self.status != "cancelled"
+        if was_booked and (not is_booked or get_slot_key(previous) != get_slot_key(self)):
+            release_slot(previous)
+        if is_booked and (not was_booked or get_slot_key(previous) != get_slot_key(self)):
+            reserve_slot(self)
+
+    def on_trash(self):
+        if self.status != "cancelled":
+            release_slot(self)
+
     def after_save(self):
         if self.status == "cancelled":
             frappe.delete_doc("Order", self.name, ignore_permissions=True)
 
+    def set_slot_times(self):
+        if not self.service_order or not self.data_lnrd:
+            return
+        if self.slot_from and self.slot_to and (self.is_new() or not self.has_value_changed("data_lnrd")):
+            return
+
+        slot_from, slot_to = parse_slot_label(self.data_lnrd)
+        if slot_from and slot_to:
+            self.slot_from = slot_from
+            self.slot_to = slot_to
+
     def calculate_total_price(self):
         if self.service_order:
-            if not self.service or not self.variation or not self.data_lnrd:
+            if not self.service or not self.variation or not self.slot_from or not self.slot_to:
                 return
-            item_doc = frappe.get_doc("Item", self.service)
-            for row in (item_doc.custom_slots_and_variations_table or []):
-                time_slot = f"{row.get('from')} - {row.to}"
-                if str(row.variation) == str(self.variation) and time_slot == self.data_lnrd:
-                    self.total_price = row.price
-                    return
+            price = frappe.db.sql("""
+                SELECT price
+                FROM `tabSlots Variations Table`
+                WHERE parenttype = 'Item'
+                    AND parentfield = 'custom_slots_and_variations_table'
+                    AND parent = %(service)s
+                    AND variation = %(variation)s
+                    AND `from` = %(slot_from)s
+                    AND `to` = %(slot_to)s
+                ORDER BY idx
+                LIMIT 1
+            """, {
+                "service": self.service,
+                "variation": str(self.variation),
+                "slot_from": normalize_time(self.slot_from),
+                "slot_to": normalize_time(self.slot_to),
+            })
+            if price:
+                self.total_price = price[0][0]
         else:
             total = 0
             for row in (self.services or []):
@@ -176,7 +220,7 @@ class Order(Document):
             return
 
         address_state = frappe.db.get_value("Customer Address", str(self.address), "state")
-        address_state_name = frappe.db.get_value("State", address_state, "name_en") if address_state else None
+        address_state_name = get_reference("State", address_state).name_en if address_state else None
 
         item_doc = frappe.get_doc("Item", self.service)
         service_drivers = [r.driver for r in (item_doc.custom_drivers or [])]
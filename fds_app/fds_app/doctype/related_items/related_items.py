@@ -0,0 +1,148 @@
+# Copyright (c) 2026, BodyKh and contributors
+# For license information, please see license.txt
+
+import json
+from collections import Counter, defaultdict
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import now
+
+NEIGHBOR_COUNT = 10
+MAX_BASKET_SIZE = 50
+
+COPURCHASE_WEIGHT = 2
+COWISHLIST_WEIGHT = 1
+
+
+def _get_purchase_baskets():
+	rows = frappe.db.sql(
+		"""SELECT o.customer, sii.item_code AS item
+		FROM `tabSales Invoice Item` sii
+		INNER JOIN `tabOrder` o ON o.name = sii.parent
+		WHERE sii.parenttype = 'Order'
+			AND sii.parentfield = 'services'
+			AND IFNULL(o.customer, '') != ''
+			AND IFNULL(o.status, '') != 'cancelled'
+		UNION
+		SELECT customer, service AS item
+		FROM `tabOrder`
+		WHERE IFNULL(service, '') != ''
+			AND IFNULL(customer, '') != ''
+			AND IFNULL(status, '') != 'cancelled'""",
+		as_dict=True,
+	)
+	return _group_baskets(rows)
+
+
+def _get_wishlist_baskets():
+	rows = frappe.db.sql(
+		"""SELECT parent AS customer, item
+		FROM `tabItem Table`
+		WHERE parenttype = 'Customer'
+			AND parentfield = 'custom_wishlist_items'""",
+		as_dict=True,
+	)
+	return _group_baskets(rows)
+
+
+def _group_baskets(rows):
+	baskets = defaultdict(list)
+	for r in rows:
+		if r.item and r.item not in baskets[r.customer]:
+			baskets[r.customer].append(r.item)
+	return baskets.values()
+
+
+def compute_related_items():
+	items = frappe.get_all(
+		"Item",
+		filters={"disabled": 0, "custom_is_business": 0},
+		fields=["name", "item_group"],
+		order_by="name asc",
+	)
+	eligible = {i.name for i in items}
+
+	group_members = defaultdict(list)
+	for i in items:
+		group_members[i.item_group].append(i.name)
+
+	scores = defaultdict(Counter)
+	for weight, baskets in (
+		(COPURCHASE_WEIGHT, _get_purchase_baskets()),
+		(COWISHLIST_WEIGHT, _get_wishlist_baskets()),
+	):
+		for basket in baskets:
+			basket = [i for i in basket if i in eligible][:MAX_BASKET_SIZE]
+			for a in basket:
+				for b in basket:
+					if a != b:
+						scores[a][b] += weight
+
+	related = {}
+	for i in items:
+		ranked = sorted(scores[i.name].items(), key=lambda pair: (-pair[1], pair[0]))
+		neighbors = [name for name, score in ranked[:NEIGHBOR_COUNT]]
+
+		# top up from the same category so every item has a full list
+		for name in group_members[i.item_group]:
+			if len(neighbors) >= NEIGHBOR_COUNT:
+				break
+			if name != i.name and name not in neighbors:
+				neighbors.append(name)
+
+		related[i.name] = neighbors
+
+	return related
+
+
+@frappe.whitelist()
+def rebuild_related_items():
+	frappe.only_for("System Manager")
+
+	related = compute_related_items()
+	timestamp = now()
+
+	frappe.db.delete("Related Items")
+	frappe.db.bulk_insert(
+		"Related Items",
+		["name", "item", "neighbors", "computed_on", "creation", "modified", "owner", "modified_by"],
+		[
+			(
+				item,
+				item,
+				json.dumps(neighbors),
+				timestamp,
+				timestamp,
+				timestamp,
+				"Administrator",
+				"Administrator",
+			)
+			for item, neighbors in related.items()
+		],
+	)
+	frappe.db.commit()
+	return len(related)
+
+
+def get_related_item_names(item, item_group=None, limit=5):
+	# the stored list is longer than `limit` so callers can drop items disabled since the rebuild
+	neighbors = frappe.db.get_value("Related Items", {"item": item}, "neighbors")
+	if neighbors:
+		return json.loads(neighbors)
+
+	# items created since the last rebuild fall back to their category
+	return frappe.get_all(
+		"Item",
+		filters={"item_group": item_group, "disabled": 0, "name": ["!=", item]},
+		pluck="name",
+		limit=limit,
+	)
+
+
+def delete_related_items(doc, method=None):
+	frappe.db.delete("Related Items", {"item": doc.name})
+
+
+class RelatedItems(Document):
+	pass
@@ -0,0 +1,87 @@
+# Copyright (c) 2026, BodyKh and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from fds_app.fds_app.doctype.related_items.related_items import (
+	compute_related_items,
+	get_related_item_names,
+	rebuild_related_items,
+)
+from fds_app.tests.utils import make_item
+
+TEST_GROUP = "_Test Related Group"
+
+
+def add_to_wishlist(customer, item):
+	frappe.get_doc(
+		{
+			"doctype": "Item Table",
+			"parent": customer,
+			"parenttype": "Customer",
+			"parentfield": "custom_wishlist_items",
+			"item": item,
+		}
+	).db_insert()
+
+
+class TestRelatedItems(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		# seeded once: inserting the same wishlist rows in every test would hit the Item Table unique index
+		if not frappe.db.exists("Item Group", TEST_GROUP):
+			frappe.get_doc(
+				{
+					"doctype": "Item Group",
+					"item_group_name": TEST_GROUP,
+					"parent_item_group": "All Item Groups",
+				}
+			).insert()
+
+		cls.items = [make_item(f"_Test Related Item {i}", item_group=TEST_GROUP).name for i in range(4)]
+		a, b, c, _d = cls.items
+
+		# b is wishlisted with a twice, c once
+		for customer, basket in (
+			("_Test Related 1", [a, b]),
+			("_Test Related 2", [a, b]),
+			("_Test Related 3", [a, c]),
+		):
+			for item in basket:
+				add_to_wishlist(customer, item)
+
+	def test_neighbors_ranked_by_co_occurrence(self):
+		a, b, c, d = self.items
+		neighbors = compute_related_items()[a]
+
+		self.assertEqual(neighbors[:2], [b, c])
+		# topped up from the same category
+		self.assertIn(d, neighbors)
+		self.assertNotIn(a, neighbors)
+
+	def test_rebuild_stores_neighbors(self):
+		a, b, c, _d = self.items
+		with patch.object(frappe.db, "commit"):
+			rebuild_related_items()
+
+		self.assertEqual(get_related_item_names(a)[:2], [b, c])
+
+	def test_fallback_to_category(self):
+		a, _b, _c, d = self.items
+		frappe.db.delete("Related Items", {"item": d})
+
+		names = get_related_item_names(d, TEST_GROUP, limit=10)
+
+		self.assertIn(a, names)
+		self.assertNotIn(d, names)
+
+	def test_rebuild_requires_system_manager(self):
+		frappe.set_user("Guest")
+		try:
+			self.assertRaises(frappe.PermissionError, rebuild_related_items)
+		finally:
+			frappe.set_user("Administrator")
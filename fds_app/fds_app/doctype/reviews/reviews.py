@@ -1,9 +1,100 @@
 # Copyright (c) 2026, BodyKh and contributors
 # For license information, please see license.txt
 
-# import frappe
+import frappe
 from frappe.model.document import Document
+from frappe.utils import cint
+
+from fds_app.fds_app.doctype.item_rating.item_rating import apply_review
+
+REACTION_COUNT_FIELDS = {
+	"liked_by": "likes_count",
+	"disliked_by": "dislikes_count",
+}
+
+
+def toggle_reaction(review_id, customer, parentfield):
+	opposite = "disliked_by" if parentfield == "liked_by" else "liked_by"
+
+	# lock the review row so concurrent taps on the same review serialize
+	review = frappe.db.get_value("Reviews", review_id, "name", for_update=True)
+	if not review:
+		raise frappe.DoesNotExistError(f"Reviews {review_id} not found")
+
+	filters = {"parent": str(review), "parenttype": "Reviews", "customer": customer}
+	deltas = {parentfield: 0, opposite: 0}
+
+	added = not frappe.db.exists("Customers Table", {**filters, "parentfield": parentfield})
+	if added:
+		if frappe.db.exists("Customers Table", {**filters, "parentfield": opposite}):
+			frappe.db.delete("Customers Table", {**filters, "parentfield": opposite})
+			deltas[opposite] = -1
+
+		idx = frappe.db.sql(
+			"""SELECT IFNULL(MAX(idx), 0) + 1 FROM `tabCustomers Table`
+			WHERE parent = %s AND parenttype = 'Reviews' AND parentfield = %s""",
+			(str(review), parentfield),
+		)[0][0]
+		frappe.get_doc(
+			{
+				"doctype": "Customers Table",
+				"parent": str(review),
+				"parenttype": "Reviews",
+				"parentfield": parentfield,
+				"customer": customer,
+				"idx": idx,
+			}
+		).db_insert()
+		deltas[parentfield] = 1
+	else:
+		frappe.db.delete("Customers Table", {**filters, "parentfield": parentfield})
+		deltas[parentfield] = -1
+
+	frappe.db.sql(
+		"""UPDATE `tabReviews`
+		SET likes_count = GREATEST(likes_count + %(likes)s, 0),
+			dislikes_count = GREATEST(dislikes_count + %(dislikes)s, 0)
+		WHERE name = %(review)s""",
+		{"review": review, "likes": deltas["liked_by"], "dislikes": deltas["disliked_by"]},
+	)
+
+	counts = frappe.db.get_value("Reviews", review, ["likes_count", "dislikes_count"], as_dict=True)
+	return added, counts
+
+
+def reconcile_reaction_counts():
+	frappe.db.sql(
+		"""UPDATE `tabReviews` r
+		LEFT JOIN (
+			SELECT parent,
+				SUM(parentfield = 'liked_by') AS likes,
+				SUM(parentfield = 'disliked_by') AS dislikes
+			FROM `tabCustomers Table`
+			WHERE parenttype = 'Reviews'
+			GROUP BY parent
+		) c ON c.parent = r.name
+		SET r.likes_count = IFNULL(c.likes, 0),
+			r.dislikes_count = IFNULL(c.dislikes, 0)
+		WHERE r.likes_count != IFNULL(c.likes, 0)
+			OR r.dislikes_count != IFNULL(c.dislikes, 0)"""
+	)
+	frappe.db.commit()
 
 
 class Reviews(Document):
-	pass
+	def validate(self):
+		self.likes_count = len(self.liked_by or [])
+		self.dislikes_count = len(self.disliked_by or [])
+
+	def on_update(self):
+		previous = self.get_doc_before_save()
+		if not previous:
+			apply_review(self.service, self.stars, 1)
+			return
+
+		if previous.service != self.service or cint(previous.stars) != cint(self.stars):
+			apply_review(previous.service, previous.stars, -1)
+			apply_review(self.service, self.stars, 1)
+
+	def on_trash(self):
+		apply_review(self.service, self.stars, -1)
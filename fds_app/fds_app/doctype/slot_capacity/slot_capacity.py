@@ -0,0 +1,144 @@
+# Copyright (c) 2026, BodyKh and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe import _
+from frappe.model.document import Document
+from frappe.utils import cint, getdate, now
+
+from fds_app.utils.slots import normalize_time
+
+SLOT_KEY_FIELDS = ["service", "variation", "slot_date", "slot_from", "slot_to"]
+
+
+class SlotUnavailableError(frappe.ValidationError):
+	pass
+
+
+def get_slot_key(order_doc):
+	if not (
+		order_doc.service_order
+		and order_doc.service
+		and order_doc.variation
+		and order_doc.order_date
+		and order_doc.slot_from
+		and order_doc.slot_to
+	):
+		return None
+
+	return frappe._dict(
+		service=order_doc.service,
+		variation=str(order_doc.variation),
+		slot_date=str(getdate(order_doc.order_date)),
+		slot_from=normalize_time(order_doc.slot_from),
+		slot_to=normalize_time(order_doc.slot_to),
+	)
+
+
+def _get_slot_limit(key):
+	max_per_day = frappe.db.sql(
+		"""SELECT max_per_day
+		FROM `tabSlots Variations Table`
+		WHERE parenttype = 'Item'
+			AND parentfield = 'custom_slots_and_variations_table'
+			AND parent = %(service)s
+			AND variation = %(variation)s
+			AND `from` = %(slot_from)s
+			AND `to` = %(slot_to)s
+		ORDER BY idx
+		LIMIT 1""",
+		key,
+	)
+	return cint(max_per_day[0][0]) if max_per_day else None
+
+
+def _count_orders(key, exclude=None):
+	return frappe.db.sql(
+		"""SELECT COUNT(*)
+		FROM `tabOrder`
+		WHERE service = %(service)s
+			AND variation = %(variation)s
+			AND order_date = %(slot_date)s
+			AND slot_from = %(slot_from)s
+			AND slot_to = %(slot_to)s
+			AND IFNULL(status, '') != 'cancelled'
+			AND name != %(exclude)s""",
+		dict(key, exclude=exclude or ""),
+	)[0][0]
+
+
+def _ensure_ledger_row(key, capacity, exclude=None):
+	if frappe.db.exists("Slot Capacity", key):
+		return
+
+	# a FOR UPDATE read of a missing row only takes a gap lock, and two first reservations holding
+	# the same gap deadlock on their inserts; the upsert makes the second one wait on the row instead
+	frappe.db.sql(
+		"""INSERT INTO `tabSlot Capacity`
+			(name, service, variation, slot_date, slot_from, slot_to, capacity, booked,
+			creation, modified, owner, modified_by, docstatus, idx)
+		VALUES
+			(%(name)s, %(service)s, %(variation)s, %(slot_date)s, %(slot_from)s, %(slot_to)s, %(capacity)s,
+			%(booked)s, %(timestamp)s, %(timestamp)s, %(user)s, %(user)s, 0, 0)
+		ON DUPLICATE KEY UPDATE name = name""",
+		dict(
+			key,
+			name=frappe.generate_hash(length=10),
+			capacity=capacity,
+			# seed from orders booked before the ledger row existed
+			booked=_count_orders(key, exclude),
+			timestamp=now(),
+			user=frappe.session.user,
+		),
+	)
+
+
+def _lock_ledger_row(key, capacity, exclude=None):
+	_ensure_ledger_row(key, capacity, exclude)
+	return frappe.db.get_value("Slot Capacity", key, ["name", "booked"], as_dict=True, for_update=True)
+
+
+def reserve_slot(order_doc):
+	key = get_slot_key(order_doc)
+	if not key:
+		return
+
+	capacity = _get_slot_limit(key)
+	if capacity is None:
+		raise SlotUnavailableError(_("Selected time slot does not exist for this variation"))
+
+	row = _lock_ledger_row(key, capacity, exclude=order_doc.name)
+	if cint(row.booked) + 1 > capacity:
+		raise SlotUnavailableError(_("Selected time slot is fully booked"))
+
+	frappe.db.set_value(
+		"Slot Capacity",
+		row.name,
+		{"booked": cint(row.booked) + 1, "capacity": capacity},
+		update_modified=False,
+	)
+
+
+def release_slot(order_doc):
+	key = get_slot_key(order_doc)
+	if not key:
+		return
+
+	frappe.db.sql(
+		"""UPDATE `tabSlot Capacity`
+		SET booked = GREATEST(booked - 1, 0)
+		WHERE service = %(service)s
+			AND variation = %(variation)s
+			AND slot_date = %(slot_date)s
+			AND slot_from = %(slot_from)s
+			AND slot_to = %(slot_to)s""",
+		key,
+	)
+
+
+def on_doctype_update():
+	frappe.db.add_unique("Slot Capacity", SLOT_KEY_FIELDS, constraint_name="unique_slot")
+
+
+class SlotCapacity(Document):
+	pass
@@ -0,0 +1,84 @@
+# Copyright (c) 2026, BodyKh and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from fds_app.fds_app.doctype.slot_capacity.slot_capacity import (
+	SlotUnavailableError,
+	get_slot_key,
+	release_slot,
+	reserve_slot,
+)
+from fds_app.tests.utils import make_item
+
+
+class TestSlotCapacity(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		# Variations are autonamed, so the item is built once against a single variation
+		cls.variation = frappe.get_doc({"doctype": "Variations", "name_en": "_Test Slot Variation"}).insert()
+		cls.item = make_item(
+			"_Test Slot Item",
+			custom_slots_and_variations_table=[
+				{"variation": cls.variation.name, "from": "09:00:00", "to": "11:00:00", "max_per_day": 2}
+			],
+		)
+
+	def setUp(self):
+		frappe.db.delete("Slot Capacity", {"service": self.item.name})
+
+	def make_booking(self, name=None):
+		return frappe._dict(
+			name=name,
+			service_order=1,
+			service=self.item.name,
+			variation=self.variation.name,
+			order_date="2026-11-02",
+			slot_from="09:00:00",
+			slot_to="11:00:00",
+		)
+
+	def get_booked(self):
+		return frappe.db.get_value("Slot Capacity", get_slot_key(self.make_booking()), "booked")
+
+	def test_reserve_until_full(self):
+		reserve_slot(self.make_booking())
+		reserve_slot(self.make_booking())
+
+		self.assertEqual(self.get_booked(), 2)
+		self.assertRaises(SlotUnavailableError, reserve_slot, self.make_booking())
+		self.assertEqual(self.get_booked(), 2)
+
+	def test_release_frees_capacity(self):
+		reserve_slot(self.make_booking())
+		reserve_slot(self.make_booking())
+
+		release_slot(self.make_booking())
+		self.assertEqual(self.get_booked(), 1)
+
+		reserve_slot(self.make_booking())
+		self.assertEqual(self.get_booked(), 2)
+
+	def test_one_ledger_row_per_slot(self):
+		reserve_slot(self.make_booking())
+		reserve_slot(self.make_booking())
+
+		self.assertEqual(frappe.db.count("Slot Capacity", {"service": self.item.name}), 1)
+
+	def test_unknown_slot_is_rejected(self):
+		booking = self.make_booking()
+		booking.slot_to = "12:00:00"
+
+		self.assertRaises(SlotUnavailableError, reserve_slot, booking)
+		self.assertFalse(frappe.db.exists("Slot Capacity", {"service": self.item.name}))
+
+	def test_non_service_order_is_ignored(self):
+		booking = self.make_booking()
+		booking.service_order = 0
+
+		reserve_slot(booking)
+
+		self.assertIsNone(get_slot_key(booking))
+		self.assertFalse(frappe.db.exists("Slot Capacity", {"service": self.item.name}))
@@ -87,6 +87,7 @@ app_include_js = [
 
 # before_install = "fds_app.install.before_install"
 # after_install = "fds_app.install.after_install"
+after_install = "fds_app.utils.indexes.add_query_indexes"
 
 # Uninstallation
 # ------------
@@ -148,6 +149,65 @@ app_include_js = [
 # 	}
 # }
 
+doc_events = {
+	"Item": {
+		"before_save": "fds_app.utils.projection.set_catalog_projection",
+		"on_update": [
+			"fds_app.utils.categories.clear_category_tree",
+			"fds_app.fds_app.doctype.item_search_index.item_search_index.update_search_index",
+			"fds_app.utils.suggest.clear_suggest_index",
+		],
+		"after_rename": [
+			"fds_app.fds_app.doctype.item_search_index.item_search_index.update_search_index",
+			"fds_app.utils.suggest.clear_suggest_index",
+		],
+		"on_trash": [
+			"fds_app.fds_app.doctype.item_rating.item_rating.delete_item_rating",
+			"fds_app.utils.categories.clear_category_tree",
+			"fds_app.fds_app.doctype.item_search_index.item_search_index.remove_from_search_index",
+			"fds_app.fds_app.doctype.related_items.related_items.delete_related_items",
+			"fds_app.utils.suggest.clear_suggest_index",
+		],
+	},
+	"Item Group": {
+		"on_update": [
+			"fds_app.utils.categories.clear_category_tree",
+			"fds_app.utils.suggest.clear_suggest_index",
+		],
+		"on_trash": [
+			"fds_app.utils.categories.clear_category_tree",
+			"fds_app.utils.suggest.clear_suggest_index",
+		],
+		"after_rename": [
+			"fds_app.utils.categories.clear_category_tree",
+			"fds_app.utils.suggest.clear_suggest_index",
+		],
+	},
+	"Customer": {
+		"on_update": "fds_app.utils.wishlist.clear_customer_wishlist",
+		"on_trash": "fds_app.utils.wishlist.clear_customer_wishlist",
+		"after_rename": "fds_app.utils.wishlist.clear_customer_wishlist",
+	},
+	"Holiday List": {
+		"on_update": "fds_app.utils.holidays.clear_holiday_index",
+		"on_trash": "fds_app.utils.holidays.clear_holiday_index",
+		"after_rename": "fds_app.utils.holidays.clear_holiday_index",
+	},
+	("Variations", "Units"): {
+		"on_update": "fds_app.utils.projection.refresh_projections_for_reference",
+	},
+	("Variations", "Units", "Brand", "Region", "State"): {
+		"on_update": "fds_app.utils.reference.clear_reference_cache",
+		"on_trash": "fds_app.utils.reference.clear_reference_cache",
+		"after_rename": "fds_app.utils.reference.clear_reference_cache",
+	},
+	("Item Group", "Sliders"): {
+		"on_update": "fds_app.utils.home.clear_home_cache",
+		"on_trash": "fds_app.utils.home.clear_home_cache",
+		"after_rename": "fds_app.utils.home.clear_home_cache",
+	},
+}
+
 # Scheduled Tasks
 # ---------------
 
@@ -169,6 +229,13 @@ app_include_js = [
 # 	],
 # }
 
+scheduler_events = {
+	"daily": [
+		"fds_app.fds_app.doctype.reviews.reviews.reconcile_reaction_counts",
+		"fds_app.fds_app.doctype.related_items.related_items.rebuild_related_items",
+	],
+}
+
 # Testing
 # -------
 
@@ -197,6 +264,8 @@ app_include_js = [
 
 # ignore_links_on_delete = ["Communication", "ToDo"]
 
+ignore_links_on_delete = ["Item Rating", "Item Search Index", "Related Items"]
+
 # Request Events
 # ----------------
 # before_request = ["fds_app.utils.before_request"]
@@ -0,0 +1,6 @@
+from fds_app.utils.indexes import add_query_indexes
+
+
+def execute():
+	# picks up the order_date / transaction_date composites added to QUERY_INDEXES
+	add_query_indexes()
@@ -0,0 +1,5 @@
+from fds_app.utils.indexes import add_query_indexes
+
+
+def execute():
+	add_query_indexes()
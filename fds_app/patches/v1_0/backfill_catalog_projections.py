@@ -0,0 +1,9 @@
+import frappe
+
+from fds_app.utils.projection import refresh_catalog_projections
+
+
+def execute():
+	items = frappe.get_all("Item", pluck="name")
+	for start in range(0, len(items), 500):
+		refresh_catalog_projections(items[start : start + 500])
@@ -0,0 +1,27 @@
+import frappe
+
+from fds_app.utils.slots import parse_slot_label
+
+
+def execute():
+	labels = frappe.db.sql_list(
+		"""SELECT DISTINCT data_lnrd FROM `tabOrder`
+		WHERE service_order = 1
+			AND IFNULL(data_lnrd, '') != ''
+			AND (slot_from IS NULL OR slot_to IS NULL)"""
+	)
+
+	for label in labels:
+		slot_from, slot_to = parse_slot_label(label)
+		if not slot_from or not slot_to:
+			continue
+
+		frappe.db.sql(
+			"""UPDATE `tabOrder` SET slot_from = %s, slot_to = %s
+			WHERE data_lnrd = %s AND (slot_from IS NULL OR slot_to IS NULL)""",
+			(slot_from, slot_to, label),
+		)
+
+	frappe.db.add_index(
+		"Order", ["service", "variation", "order_date", "slot_from", "slot_to"], "slot_booking_index"
+	)
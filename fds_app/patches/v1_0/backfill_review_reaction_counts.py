@@ -0,0 +1,5 @@
+from fds_app.fds_app.doctype.reviews.reviews import reconcile_reaction_counts
+
+
+def execute():
+	reconcile_reaction_counts()
@@ -0,0 +1,5 @@
+from fds_app.fds_app.doctype.item_search_index.item_search_index import rebuild_search_index
+
+
+def execute():
+	rebuild_search_index()
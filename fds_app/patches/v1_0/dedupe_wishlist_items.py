@@ -0,0 +1,14 @@
+import frappe
+
+
+def execute():
+	# the unique (parent, parenttype, parentfield, item) key is added during model sync
+	frappe.db.sql(
+		"""DELETE t1 FROM `tabItem Table` t1
+		JOIN `tabItem Table` t2
+			ON t1.parent = t2.parent
+			AND t1.parenttype = t2.parenttype
+			AND t1.parentfield = t2.parentfield
+			AND t1.item = t2.item
+			AND t1.name > t2.name"""
+	)
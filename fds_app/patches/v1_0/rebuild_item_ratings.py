@@ -0,0 +1,5 @@
+from fds_app.fds_app.doctype.item_rating.item_rating import rebuild_item_ratings
+
+
+def execute():
+	rebuild_item_ratings()
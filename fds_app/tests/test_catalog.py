@@ -0,0 +1,41 @@
+# Copyright (c) 2026, BodyKh and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from fds_app.tests.utils import make_item
+from fds_app.utils.catalog import get_wishlist_page
+from fds_app.utils.wishlist import add_wishlist_item
+
+CUSTOMER = "_Test Catalog Customer"
+
+
+class TestWishlistPage(FrappeTestCase):
+	def setUp(self):
+		self.items = [make_item(f"_Test Catalog Item {i}").name for i in range(3)]
+		frappe.db.delete("Item Table", {"parent": CUSTOMER})
+		for item in self.items:
+			add_wishlist_item(CUSTOMER, item)
+		# the first row was touched last, so modified order differs from idx order
+		frappe.db.sql(
+			"UPDATE `tabItem Table` SET modified = %s WHERE parent = %s AND item = %s",
+			("2099-01-01 00:00:00", CUSTOMER, self.items[0]),
+		)
+
+	def test_unpaged_keeps_idx_order(self):
+		items, cursor = get_wishlist_page(CUSTOMER)
+
+		self.assertEqual([item.name for item in items], self.items)
+		self.assertIsNone(cursor)
+
+	def test_paged_by_modified(self):
+		names, cursor = [], None
+		while True:
+			items, cursor = get_wishlist_page(CUSTOMER, limit=2, cursor=cursor)
+			names += [item.name for item in items]
+			if not cursor:
+				break
+
+		self.assertEqual(names[0], self.items[0])
+		self.assertCountEqual(names, self.items)
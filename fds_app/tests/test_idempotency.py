@@ -0,0 +1,114 @@
+# Copyright (c) 2026, BodyKh and Contributors
+# See license.txt
+
+from types import SimpleNamespace
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from fds_app.utils import idempotency
+from fds_app.utils.idempotency import idempotent
+
+calls = []
+
+
+@idempotent("test_create", "customer_id")
+def create_thing(customer_id=None, qty=None, fail=False):
+	calls.append(customer_id)
+	frappe.response["status"] = not fail
+	frappe.response["message"] = "Failed" if fail else "Created"
+	frappe.response["data"] = {"call": len(calls)}
+
+
+class TestIdempotency(FrappeTestCase):
+	def setUp(self):
+		calls.clear()
+		self.key = frappe.generate_hash(length=12)
+		self.set_request(customer_id="_Test Customer", qty=1)
+
+	def tearDown(self):
+		for caller in ("_Test Customer", "_Test Customer 2"):
+			frappe.cache().delete_value(idempotency._cache_key("test_create", caller, self.key))
+		del frappe.local.request
+
+	def set_request(self, body=b"", headers=None, **args):
+		frappe.local.form_dict = frappe._dict(args)
+		frappe.local.request = SimpleNamespace(
+			headers={idempotency.HEADER: self.key, **(headers or {})}, get_data=lambda: body
+		)
+		frappe.local.response = frappe._dict()
+
+	def call(self):
+		frappe.local.response = frappe._dict()
+		create_thing(**frappe.form_dict)
+		return frappe.local.response
+
+	def test_retry_replays_response(self):
+		first = self.call()
+		second = self.call()
+
+		self.assertEqual(len(calls), 1)
+		self.assertEqual(second.data, first.data)
+		self.assertTrue(second.status)
+
+	def test_mismatched_arguments_are_rejected(self):
+		self.call()
+		self.set_request(customer_id="_Test Customer", qty=2)
+
+		response = self.call()
+
+		self.assertEqual(len(calls), 1)
+		self.assertEqual(response.http_status_code, 409)
+		self.assertFalse(response.status)
+
+	def test_mismatched_raw_body_is_rejected(self):
+		self.set_request(body=b'{"expenses": 10}', customer_id="_Test Customer")
+		self.call()
+		self.set_request(body=b'{"expenses": 20}', customer_id="_Test Customer")
+
+		response = self.call()
+
+		self.assertEqual(len(calls), 1)
+		self.assertEqual(response.http_status_code, 409)
+
+	def test_call_in_progress_is_rejected(self):
+		cache_key = idempotency._cache_key("test_create", "_Test Customer", self.key)
+		self.assertTrue(idempotency._acquire(f"{cache_key}:lock"))
+		try:
+			response = self.call()
+		finally:
+			frappe.cache().delete_value(f"{cache_key}:lock")
+
+		self.assertEqual(calls, [])
+		self.assertEqual(response.http_status_code, 409)
+
+	def test_failure_is_not_cached(self):
+		self.set_request(customer_id="_Test Customer", fail=True)
+		self.call()
+		self.call()
+
+		self.assertEqual(len(calls), 2)
+
+	def test_key_is_scoped_by_caller(self):
+		self.call()
+		self.set_request(customer_id="_Test Customer 2", qty=1)
+
+		response = self.call()
+
+		self.assertEqual(calls, ["_Test Customer", "_Test Customer 2"])
+		self.assertTrue(response.status)
+
+	def test_caller_from_json_body(self):
+		self.set_request(body=b'{"driver_id": "_Test Driver"}')
+
+		self.assertEqual(idempotency.get_caller("driver_id", {}), "_Test Driver")
+
+	def test_without_key_every_call_runs(self):
+		self.key = None
+		self.set_request(customer_id="_Test Customer", qty=1)
+		frappe.local.request.headers = {}
+
+		self.call()
+		self.call()
+
+		self.assertEqual(len(calls), 2)
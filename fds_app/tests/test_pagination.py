@@ -0,0 +1,47 @@
+# Copyright (c) 2026, BodyKh and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from fds_app.utils.pagination import get_page
+
+
+class TestPagination(FrappeTestCase):
+	def setUp(self):
+		self.units = [
+			frappe.get_doc({"doctype": "Units", "name_en": f"Pagination Test {i}"}).insert().name
+			for i in range(6)
+		]
+		# every row shares one sort value, so paging relies on the name tie-break alone
+		frappe.db.sql(
+			"UPDATE `tabUnits` SET modified = %s WHERE name IN %s",
+			("2026-01-01 00:00:00", tuple(self.units)),
+		)
+
+	def get_all_pages(self, filters, limit=2):
+		names, cursor = [], None
+		while True:
+			rows, cursor = get_page("Units", filters=filters, limit=limit, cursor=cursor)
+			names += [row.name for row in rows]
+			if not cursor:
+				return names
+
+	def test_cursor_keeps_caller_name_filter(self):
+		matches = self.units[::2]
+		names = self.get_all_pages({"name": ["in", matches]})
+
+		self.assertEqual(names, sorted(matches, reverse=True))
+
+	def test_cursor_keeps_caller_sort_field_filter(self):
+		names = self.get_all_pages(
+			{"name": ["in", self.units], "modified": ["<=", "2026-01-01 00:00:00"]}, limit=4
+		)
+
+		self.assertEqual(names, sorted(self.units, reverse=True))
+
+	def test_list_filters(self):
+		matches = self.units[1:4]
+		names = self.get_all_pages([["Units", "name", "in", matches]])
+
+		self.assertEqual(names, sorted(matches, reverse=True))
@@ -0,0 +1,18 @@
+import frappe
+
+
+def make_item(item_code, **kwargs):
+	if frappe.db.exists("Item", item_code):
+		return frappe.get_doc("Item", item_code)
+
+	return frappe.get_doc(
+		{
+			"doctype": "Item",
+			"item_code": item_code,
+			"item_name": kwargs.pop("item_name", item_code),
+			"item_group": kwargs.pop("item_group", "All Item Groups"),
+			"stock_uom": kwargs.pop("stock_uom", "Nos"),
+			"is_stock_item": 0,
+			**kwargs,
+		}
+	).insert()
@@ -0,0 +1,225 @@
+import frappe
+from frappe.utils import cint
+
+from fds_app.fds_app.doctype.item_rating.item_rating import get_item_ratings
+from fds_app.utils.holidays import get_holiday_dates
+from fds_app.utils.pagination import decode_cursor, encode_cursor, get_page_length, is_paged
+from fds_app.utils.projection import get_catalog_projections
+from fds_app.utils.reference import get_reference
+from fds_app.utils.wishlist import WISHLIST_FILTERS, get_wishlist_set
+
+ITEM_LIST_FIELDS = [
+	"name",
+	"item_name",
+	"custom_item_name_ar",
+	"description",
+	"custom_description_ar",
+	"brand",
+	"custom_max_per_order",
+	"is_stock_item",
+	"item_group",
+	"image",
+	"custom_holiday_list",
+	"custom_fixed_price",
+	"custom_is_business",
+	"custom_catalog_projection",
+]
+
+
+def get_brand_names(brands):
+	return {b: get_reference("Brand", b).brand for b in brands if b}
+
+
+def get_customer_names(customers):
+	customers = list({c for c in customers if c})
+	if not customers:
+		return {}
+
+	rows = frappe.get_all("Customer", filters={"name": ["in", customers]}, fields=["name", "customer_name"])
+	return {r.name: r.customer_name for r in rows}
+
+
+def get_viewer_reactions(review_names, user_id):
+	reactions = {"liked_by": set(), "disliked_by": set()}
+	parents = [str(n) for n in review_names]
+	if not parents or not user_id:
+		return reactions
+
+	rows = frappe.get_all(
+		"Customers Table",
+		filters={
+			"parent": ["in", parents],
+			"parenttype": "Reviews",
+			"parentfield": ["in", list(reactions)],
+			"customer": user_id,
+		},
+		fields=["parent", "parentfield"],
+	)
+	for r in rows:
+		reactions[r.parentfield].add(r.parent)
+	return reactions
+
+
+def build_review_list(reviews, user_id=None, product_id=None):
+	review_names = [r.name for r in reviews]
+	reactions = get_viewer_reactions(review_names, user_id)
+	customer_names = get_customer_names(r.customer for r in reviews)
+
+	review_list = []
+	for r in reviews:
+		key = str(r.name)
+		review_list.append(
+			{
+				"id": int(r.name),
+				"product_id": product_id or r.service,
+				"user_id": r.customer,
+				"rating": r.stars,
+				"review_likes": r.likes_count or 0,
+				"review_dislikes": r.dislikes_count or 0,
+				"is_user_like": 1 if key in reactions["liked_by"] else 0,
+				"is_user_dislike": 1 if key in reactions["disliked_by"] else 0,
+				"review_msg": r.review,
+				"user_name": customer_names.get(r.customer),
+				"created_at": str(r.creation),
+			}
+		)
+	return review_list
+
+
+REVIEW_FIELDS = [
+	"name",
+	"service",
+	"customer",
+	"stars",
+	"review",
+	"creation",
+	"likes_count",
+	"dislikes_count",
+]
+
+
+def get_item_reviews(item_names, user_id=None, limit=None):
+	if not item_names:
+		return {}
+
+	if limit is None:
+		reviews = frappe.get_all(
+			"Reviews",
+			filters={"service": ["in", list(item_names)]},
+			fields=REVIEW_FIELDS,
+			order_by="creation desc",
+		)
+	elif cint(limit) <= 0:
+		return {}
+	else:
+		reviews = frappe.db.sql(
+			"""SELECT {fields}
+			FROM (
+				SELECT {fields},
+					ROW_NUMBER() OVER (PARTITION BY service ORDER BY creation DESC, name DESC) AS review_rank
+				FROM `tabReviews`
+				WHERE service IN %(items)s
+			) ranked
+			WHERE review_rank <= %(limit)s
+			ORDER BY creation DESC, name DESC""".format(fields=", ".join(f"`{f}`" for f in REVIEW_FIELDS)),
+			{"items": tuple(item_names), "limit": cint(limit)},
+			as_dict=True,
+		)
+
+	item_reviews = {}
+	for review in build_review_list(reviews, user_id):
+		item_reviews.setdefault(review["product_id"], []).append(review)
+	return item_reviews
+
+
+def get_wishlist_items(user_id, item_names):
+	return get_wishlist_set(user_id) & set(item_names)
+
+
+def get_wishlist_page(customer, limit=None, cursor=None):
+	# one join from the customer's Item Table rows to Item, keyset paged on the wishlist row
+	values = {**WISHLIST_FILTERS, "customer": customer}
+	conditions = ""
+	if cursor:
+		values["modified"], values["row"] = decode_cursor(cursor)
+		conditions = "AND (wl.modified < %(modified)s OR (wl.modified = %(modified)s AND wl.name < %(row)s))"
+
+	# unpaged callers keep the order the rows have on the Customer form
+	order_by = "wl.idx ASC"
+	page = ""
+	if is_paged(limit, cursor):
+		order_by = "wl.modified DESC, wl.name DESC"
+		values["limit"] = get_page_length(limit) + 1
+		page = "LIMIT %(limit)s"
+
+	items = frappe.db.sql(
+		"""SELECT wl.name AS wishlist_row, wl.modified AS wishlist_modified, {fields}
+		FROM `tabItem Table` wl
+		INNER JOIN `tabItem` i ON i.name = wl.item
+		WHERE wl.parent = %(customer)s
+			AND wl.parenttype = %(parenttype)s
+			AND wl.parentfield = %(parentfield)s
+			{conditions}
+		ORDER BY {order_by}
+		{page}""".format(
+			fields=", ".join(f"i.`{f}`" for f in ITEM_LIST_FIELDS),
+			conditions=conditions,
+			order_by=order_by,
+			page=page,
+		),
+		values,
+		as_dict=True,
+	)
+
+	next_cursor = None
+	if page and len(items) > get_page_length(limit):
+		items = items[: get_page_length(limit)]
+		last = items[-1]
+		next_cursor = encode_cursor(frappe._dict(name=last.wishlist_row, modified=last.wishlist_modified))
+
+	return items, next_cursor
+
+
+def build_item_list(items, user_id=None, base_url=None, reviews_limit=None, holiday_window=None):
+	base_url = base_url or frappe.utils.get_url()
+	item_names = [item.name for item in items]
+
+	brand_names = get_brand_names(item.brand for item in items)
+	item_reviews = get_item_reviews(item_names, user_id, limit=reviews_limit)
+	ratings = get_item_ratings(item_names)
+	wishlist = get_wishlist_items(user_id, item_names)
+	projections = get_catalog_projections(items)
+
+	item_list = []
+	for item in items:
+		rating, rating_count = ratings.get(item.name, (0, 0))
+		projection = projections.get(item.name) or {}
+
+		item_list.append(
+			{
+				"id": item.name,
+				"name_en": item.item_name,
+				"name_ar": item.custom_item_name_ar,
+				"desc_en": item.description,
+				"desc_ar": item.custom_description_ar,
+				"brand_name": brand_names.get(item.brand),
+				"is_service": 1 if item.is_stock_item == 0 else 0,
+				"has_variation": 1 if item.is_stock_item == 0 else 0,
+				"category": item.item_group,
+				"image": base_url + item.image if item.image else None,
+				"max_purchase_qty": item.custom_max_per_order,
+				"holidays": get_holiday_dates(item.custom_holiday_list, holiday_window),
+				"reviews": item_reviews.get(item.name, []),
+				"rating": rating,
+				"rating_count": rating_count,
+				"is_wish_list": 1 if item.name in wishlist else 0,
+				"min_price": projection.get("min_price", 0),
+				"max_price": projection.get("max_price", 0),
+				"unit_name": projection.get("unit_name_en"),
+				"unit_name_ar": projection.get("unit_name_ar"),
+				"variation_data": projection.get("variation_data", []),
+				"fixed_price": item.custom_fixed_price,
+			}
+		)
+
+	return item_list
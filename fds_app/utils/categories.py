@@ -0,0 +1,108 @@
+from bisect import bisect_left
+
+import frappe
+from frappe.utils import cint
+
+CACHE_KEY = "fds_app:category_tree"
+
+ITEM_COUNT_FIELDS = ("item_group", "custom_is_business", "disabled")
+
+
+def _build_tree():
+	groups = frappe.get_all(
+		"Item Group",
+		fields=["name", "parent_item_group", "is_group", "custom_name_ar", "image", "lft", "rgt"],
+		order_by="lft asc",
+	)
+
+	direct_counts = {}
+	rows = frappe.db.sql(
+		"""SELECT item_group, IFNULL(custom_is_business, 0), COUNT(*)
+		FROM `tabItem`
+		WHERE disabled = 0
+		GROUP BY item_group, IFNULL(custom_is_business, 0)"""
+	)
+	for item_group, is_business, count in rows:
+		counts = direct_counts.setdefault(item_group, [0, 0])
+		counts[1 if cint(is_business) else 0] += cint(count)
+
+	# in lft order every subtree is a contiguous run: the node itself up to the first lft past its rgt
+	order = [g.name for g in groups]
+	lefts = [cint(g.lft) for g in groups]
+	running = [[0, 0]]
+	for name in order:
+		counts = direct_counts.get(name, [0, 0])
+		running.append([running[-1][0] + counts[0], running[-1][1] + counts[1]])
+
+	nodes = {}
+	for start, g in enumerate(groups):
+		end = max(bisect_left(lefts, cint(g.rgt), lo=start), start + 1)
+		nodes[g.name] = frappe._dict(
+			name=g.name,
+			parent=g.parent_item_group,
+			is_group=cint(g.is_group),
+			name_ar=g.custom_name_ar,
+			image=g.image,
+			start=start,
+			end=end,
+			children=[],
+			item_count=running[end][0] - running[start][0],
+			business_item_count=running[end][1] - running[start][1],
+		)
+
+	for name in order:
+		parent = nodes[name].parent
+		if parent in nodes:
+			nodes[parent].children.append(name)
+
+	return frappe._dict(order=order, nodes=nodes)
+
+
+def get_category_tree():
+	tree = getattr(frappe.local, "fds_category_tree", None)
+	if tree is None:
+		tree = frappe.local.fds_category_tree = frappe.cache().get_value(CACHE_KEY, generator=_build_tree)
+	return tree
+
+
+def get_category(category):
+	return get_category_tree().nodes.get(category)
+
+
+def get_subtree(category):
+	tree = get_category_tree()
+	node = tree.nodes.get(category)
+	if not node:
+		return [category]
+	return tree.order[node.start : node.end]
+
+
+def get_child_categories(category=None, is_group=None):
+	tree = get_category_tree()
+	if category:
+		node = tree.nodes.get(category)
+		names = node.children if node else []
+	else:
+		names = tree.order
+
+	nodes = [tree.nodes[name] for name in names]
+	if is_group is not None:
+		nodes = [n for n in nodes if n.is_group == cint(is_group)]
+	return sorted(nodes, key=lambda n: n.name)
+
+
+def _drop_tree():
+	frappe.cache().delete_value(CACHE_KEY)
+	frappe.local.fds_category_tree = None
+
+
+def clear_category_tree(doc, method=None, *args):
+	if (
+		doc.doctype == "Item"
+		and method == "on_update"
+		and not any(doc.has_value_changed(field) for field in ITEM_COUNT_FIELDS)
+	):
+		return
+
+	_drop_tree()
+	frappe.db.after_commit.add(_drop_tree)
@@ -0,0 +1,69 @@
+from bisect import bisect_left, bisect_right
+
+import frappe
+from frappe.utils import add_days, cint, getdate, nowdate
+
+CACHE_KEY = "fds_app:holiday_index"
+
+
+def _load_dates(holiday_list):
+	return sorted(
+		{
+			str(d)
+			for d in frappe.get_all(
+				"Holiday",
+				filters={"parent": holiday_list, "parenttype": "Holiday List"},
+				pluck="holiday_date",
+			)
+		}
+	)
+
+
+def get_holiday_index(holiday_list):
+	request_cache = getattr(frappe.local, "fds_holiday_index", None)
+	if request_cache is None:
+		request_cache = frappe.local.fds_holiday_index = {}
+	if holiday_list in request_cache:
+		return request_cache[holiday_list]
+
+	dates = frappe.cache().hget(CACHE_KEY, holiday_list, generator=lambda: _load_dates(holiday_list))
+	index = frappe._dict(dates=dates, date_set=frozenset(dates))
+	request_cache[holiday_list] = index
+	return index
+
+
+def is_holiday(holiday_list, date):
+	if not holiday_list or not date:
+		return False
+	return str(getdate(date)) in get_holiday_index(holiday_list).date_set
+
+
+def get_holidays_between(holiday_list, from_date, to_date):
+	if not holiday_list:
+		return []
+	dates = get_holiday_index(holiday_list).dates
+	return dates[bisect_left(dates, str(getdate(from_date))) : bisect_right(dates, str(getdate(to_date)))]
+
+
+def get_holiday_dates(holiday_list, window=None):
+	if not holiday_list:
+		return []
+	if window is None:
+		return list(get_holiday_index(holiday_list).dates)
+
+	today = nowdate()
+	return get_holidays_between(holiday_list, today, add_days(today, cint(window)))
+
+
+def _drop_index(names):
+	request_cache = getattr(frappe.local, "fds_holiday_index", None)
+	for name in names:
+		frappe.cache().hdel(CACHE_KEY, name)
+		if request_cache:
+			request_cache.pop(name, None)
+
+
+def clear_holiday_index(doc, method=None, old_name=None, *args):
+	names = {doc.name, old_name} - {None}
+	_drop_index(names)
+	frappe.db.after_commit.add(lambda: _drop_index(names))
@@ -0,0 +1,100 @@
+import hashlib
+
+import frappe
+from werkzeug.wrappers import Response
+
+VERSION_KEY = "fds_app:home:version"
+CACHE_EXPIRY = 7 * 24 * 60 * 60
+
+
+def _payload_key(version, base_url):
+	return f"fds_app:home:{version}:{hashlib.md5(base_url.encode()).hexdigest()}"
+
+
+def _get_version():
+	version = frappe.cache().get_value(VERSION_KEY)
+	if not version:
+		version = frappe.generate_hash(length=10)
+		frappe.cache().set_value(VERSION_KEY, version)
+	return version
+
+
+def build_home_data(base_url):
+	categories = frappe.get_all(
+		"Item Group", filters={"is_group": 1}, fields=["name", "custom_name_ar", "image"], order_by="name asc"
+	)
+
+	category_list = []
+	for c in categories:
+		category_list.append(
+			{
+				"id": c.name,
+				"name_en": c.name,
+				"name_ar": c.custom_name_ar,
+				"image": base_url + c.image if c.image else None,
+			}
+		)
+
+	sliders = frappe.get_all(
+		"Sliders", fields=["name", "name1", "image", "url", "message"], order_by="modified desc"
+	)
+
+	slider_list = []
+	for s in sliders:
+		slider_list.append(
+			{
+				"id": s.name,
+				"name": s.name1,
+				"image": base_url + s.image if s.image else None,
+				"url": s.url,
+				"message": s.message,
+			}
+		)
+
+	return {"categories": category_list, "sliders": slider_list}
+
+
+def get_home_payload(base_url):
+	version = _get_version()
+	key = _payload_key(version, base_url)
+
+	payload = frappe.cache().get_value(key)
+	if payload is None:
+		body = frappe.as_json(
+			{
+				"status": True,
+				"message": "Home data fetched successfully",
+				"data": build_home_data(base_url),
+			},
+			indent=None,
+			separators=(",", ":"),
+		)
+		payload = frappe._dict(
+			etag=f"{version}-{hashlib.md5(body.encode()).hexdigest()[:12]}",
+			body=body,
+		)
+		frappe.cache().set_value(key, payload, expires_in_sec=CACHE_EXPIRY)
+
+	return payload
+
+
+def make_home_response(payload):
+	request = getattr(frappe.local, "request", None)
+	headers = {"ETag": f'"{payload.etag}"', "Cache-Control": "no-cache"}
+
+	if request and request.if_none_match.contains(payload.etag):
+		return Response(status=304, headers=headers)
+
+	return Response(payload.body, status=200, headers=headers, mimetype="application/json")
+
+
+def _rebuild(base_url):
+	frappe.cache().set_value(VERSION_KEY, frappe.generate_hash(length=10))
+	get_home_payload(base_url)
+
+
+def clear_home_cache(doc, method=None, *args):
+	frappe.cache().set_value(VERSION_KEY, frappe.generate_hash(length=10))
+	# rebuild once the change is committed so the next app launch is served from cache
+	base_url = frappe.utils.get_url()
+	frappe.db.after_commit.add(lambda: _rebuild(base_url))
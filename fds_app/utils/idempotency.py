@@ -0,0 +1,104 @@
+import hashlib
+import json
+from functools import wraps
+
+import frappe
+
+HEADER = "Idempotency-Key"
+RESULT_TTL = 24 * 60 * 60
+LOCK_TIMEOUT = 60
+
+# form_dict entries that say how a request was routed, not what it asked for
+IGNORED_ARGS = {"cmd", "idempotency_key"}
+
+
+def get_idempotency_key():
+	return frappe.get_request_header(HEADER) or frappe.form_dict.get("idempotency_key")
+
+
+def _request_body():
+	request = getattr(frappe.local, "request", None)
+	return request.get_data() if request else b""
+
+
+def _request_json():
+	try:
+		body = json.loads(_request_body() or b"{}")
+	except ValueError:
+		return {}
+	return body if isinstance(body, dict) else {}
+
+
+def get_caller(caller_arg, kwargs):
+	# the endpoints allow guests, so the session user is "Guest" for every app and the
+	# customer or driver named in the request is what tells callers apart
+	return kwargs.get(caller_arg) or frappe.form_dict.get(caller_arg) or _request_json().get(caller_arg)
+
+
+def _cache_key(scope, caller, key):
+	return f"fds_app:idempotency:{scope}:{caller or frappe.session.user}:{key}"
+
+
+def _fingerprint():
+	args = {k: v for k, v in frappe.form_dict.items() if k not in IGNORED_ARGS}
+	digest = hashlib.sha256(json.dumps(args, sort_keys=True, default=str).encode())
+	# create_driver_log reads the raw body, which form_dict misses unless it is sent as JSON
+	digest.update(_request_body())
+	return digest.hexdigest()
+
+
+def _acquire(lock_key):
+	cache = frappe.cache()
+	return cache.set(cache.make_key(lock_key), 1, nx=True, ex=LOCK_TIMEOUT)
+
+
+def _reject(message):
+	frappe.local.response.http_status_code = 409
+	frappe.response["status"] = False
+	frappe.response["message"] = message
+	frappe.response["data"] = None
+
+
+def idempotent(scope, caller_arg):
+	# replays the stored response of a successful call made with the same key instead of running it again
+	def decorator(fn):
+		@wraps(fn)
+		def wrapper(*args, **kwargs):
+			key = get_idempotency_key()
+			if not key:
+				return fn(*args, **kwargs)
+
+			cache_key = _cache_key(scope, get_caller(caller_arg, kwargs), key)
+			lock_key = f"{cache_key}:lock"
+			fingerprint = _fingerprint()
+
+			stored = frappe.cache().get_value(cache_key)
+			if stored:
+				if stored["fingerprint"] != fingerprint:
+					return _reject("Idempotency key was already used with different parameters")
+				frappe.response.update(stored["response"])
+				return stored["result"]
+
+			if not _acquire(lock_key):
+				return _reject("A request with this idempotency key is still being processed")
+
+			try:
+				result = fn(*args, **kwargs)
+				# failures are not stored so the client can retry them
+				if frappe.response.get("status"):
+					frappe.cache().set_value(
+						cache_key,
+						{
+							"fingerprint": fingerprint,
+							"response": {k: v for k, v in frappe.response.items() if k != "docs"},
+							"result": result,
+						},
+						expires_in_sec=RESULT_TTL,
+					)
+				return result
+			finally:
+				frappe.cache().delete_value(lock_key)
+
+		return wrapper
+
+	return decorator
@@ -0,0 +1,221 @@
+import ast
+import glob
+import json
+import os
+from collections import namedtuple
+
+# composite indexes for the hot API filters; single-column ones live in the doctype JSONs (search_index)
+QUERY_INDEXES = [
+	("Order", ["service", "variation", "order_date", "status"], "service_variation_date_status_index"),
+	("Order", ["service", "variation", "order_date", "slot_from", "slot_to"], "slot_booking_index"),
+	("Order", ["customer", "creation"], "customer_creation_index"),
+	("Order", ["driver", "creation"], "driver_creation_index"),
+	("Order", ["customer", "order_date"], "customer_order_date_index"),
+	("Order", ["driver", "order_date"], "driver_order_date_index"),
+	("Sales Order", ["customer", "transaction_date"], "customer_transaction_date_index"),
+	("Reviews", ["service", "creation"], "service_creation_index"),
+	("Carts", ["customer", "service", "variation"], "customer_service_variation_index"),
+	("Customers Table", ["parent", "parentfield", "customer"], "parent_parentfield_customer_index"),
+	("Item Table", ["parent", "parentfield", "item"], "parent_parentfield_item_index"),
+]
+
+# modules whose frappe queries back the whitelisted endpoints
+QUERY_MODULES = ["api/*.py", "utils/*.py"]
+
+QUERY_FUNCTIONS = {
+	"frappe.get_all",
+	"frappe.get_list",
+	"frappe.db.get_all",
+	"frappe.db.get_list",
+	"frappe.db.get_value",
+	"frappe.db.get_values",
+	"frappe.db.exists",
+	"frappe.db.count",
+	"frappe.db.delete",
+	"get_page",
+}
+
+# frappe creates these on every table; "parent" only on child tables
+STANDARD_INDEXES = {"name", "modified"}
+
+# kept out of the noqa syntax, which ruff would try to parse as one of its own directives
+SKIP_MARKER = "query-index: ok"
+
+UnindexedQuery = namedtuple("UnindexedQuery", ["path", "line", "doctype", "fields"])
+
+
+def add_query_indexes():
+	# imported here so the source check below runs without frappe installed
+	import frappe
+
+	for doctype, fields, index_name in QUERY_INDEXES:
+		frappe.db.add_index(doctype, fields, index_name)
+
+
+def _app_path(*parts):
+	return os.path.join(os.path.dirname(os.path.dirname(__file__)), *parts)
+
+
+def get_indexed_fields():
+	indexed = {}
+
+	for path in glob.glob(_app_path("fds_app", "doctype", "*", "*.json")):
+		with open(path) as f:
+			meta = json.load(f)
+		if meta.get("doctype") != "DocType":
+			continue
+
+		fields = set(STANDARD_INDEXES)
+		if meta.get("istable"):
+			fields.add("parent")
+		fields.update(
+			df["fieldname"] for df in meta.get("fields", []) if df.get("search_index") or df.get("unique")
+		)
+		indexed[meta["name"]] = fields
+
+	for doctype, index_fields, _index_name in QUERY_INDEXES:
+		if doctype in indexed:
+			indexed[doctype].add(index_fields[0])
+
+	return indexed
+
+
+def _call_name(node):
+	parts = []
+	while isinstance(node, ast.Attribute):
+		parts.append(node.attr)
+		node = node.value
+	if isinstance(node, ast.Name):
+		parts.append(node.id)
+	return ".".join(reversed(parts))
+
+
+def _dict_keys(node, assignments):
+	if isinstance(node, ast.Name):
+		node = assignments.get(node.id)
+	if not isinstance(node, ast.Dict):
+		return None
+
+	keys = set()
+	for key, value in zip(node.keys, node.values, strict=True):
+		if key is None:
+			nested = _dict_keys(value, assignments)
+			if nested is None:
+				return None
+			keys.update(nested)
+		elif isinstance(key, ast.Constant) and isinstance(key.value, str):
+			keys.add(key.value)
+		else:
+			return None
+	return keys
+
+
+def _filter_fields(node, assignments):
+	if node is None:
+		return set()
+
+	keys = _dict_keys(node, assignments)
+	if keys is not None:
+		return keys
+
+	if isinstance(node, ast.Name):
+		node = assignments.get(node.id)
+	if isinstance(node, ast.List | ast.Tuple):
+		fields = set()
+		for condition in node.elts:
+			if not isinstance(condition, ast.List | ast.Tuple) or len(condition.elts) < 3:
+				return None
+			field = condition.elts[1] if len(condition.elts) == 4 else condition.elts[0]
+			if not (isinstance(field, ast.Constant) and isinstance(field.value, str)):
+				return None
+			fields.add(field.value)
+		return fields
+
+	# a bare value filters by name
+	return {"name"}
+
+
+def _get_argument(call, position, keyword):
+	for kw in call.keywords:
+		if kw.arg == keyword:
+			return kw.value
+	if len(call.args) > position:
+		return call.args[position]
+	return None
+
+
+def _iter_queries(tree):
+	for func in ast.walk(tree):
+		if not isinstance(func, ast.FunctionDef | ast.AsyncFunctionDef):
+			continue
+
+		assignments = {}
+		for node in ast.walk(func):
+			if (
+				isinstance(node, ast.Assign)
+				and len(node.targets) == 1
+				and isinstance(node.targets[0], ast.Name)
+			):
+				assignments[node.targets[0].id] = node.value
+
+		for node in ast.walk(func):
+			if isinstance(node, ast.Call) and _call_name(node.func) in QUERY_FUNCTIONS:
+				yield node, assignments
+
+
+def find_unindexed_queries():
+	indexed = get_indexed_fields()
+	unindexed = []
+
+	for pattern in QUERY_MODULES:
+		for path in sorted(glob.glob(_app_path(pattern))):
+			with open(path) as f:
+				source = f.read()
+			lines = source.splitlines()
+
+			seen = set()
+			for call, assignments in _iter_queries(ast.parse(source)):
+				if (call.lineno, call.col_offset) in seen or SKIP_MARKER in lines[call.lineno - 1]:
+					continue
+				seen.add((call.lineno, call.col_offset))
+
+				doctype = _get_argument(call, 0, "doctype")
+				if not (isinstance(doctype, ast.Constant) and doctype.value in indexed):
+					continue
+
+				# dict filters with no keys (and get_all without filters) read the whole table on purpose
+				fields = _filter_fields(_get_argument(call, 1, "filters"), assignments)
+				if not fields or fields & indexed[doctype.value]:
+					continue
+
+				unindexed.append(
+					UnindexedQuery(
+						path=os.path.relpath(path, _app_path()),
+						line=call.lineno,
+						doctype=doctype.value,
+						fields=sorted(fields),
+					)
+				)
+
+	return unindexed
+
+
+def report_unindexed_queries():
+	unindexed = find_unindexed_queries()
+	for query in unindexed:
+		print(
+			f"{query.path}:{query.line}: {query.doctype} filtered by {', '.join(query.fields)} without an index"
+		)
+
+	if unindexed:
+		print(
+			"Add search_index to one of the fields, a composite index to fds_app.utils.indexes.QUERY_INDEXES,"
+		)
+		print(f"or mark the line with '# {SKIP_MARKER}' if the table stays small")
+
+	return len(unindexed)
+
+
+if __name__ == "__main__":
+	# reads only the source tree, so the pre-commit hook runs without a site
+	raise SystemExit(1 if report_unindexed_queries() else 0)
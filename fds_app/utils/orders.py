@@ -0,0 +1,128 @@
+import frappe
+
+ORDER_VIEW_FIELDS = [
+	"name",
+	"creation",
+	"status",
+	"payment_status",
+	"payment_method",
+	"total_price",
+	"service_order",
+	"order_date",
+	"note",
+	"driver_note",
+	"data_lnrd",
+	"customer",
+	"customer_first_name",
+	"customer_last_name",
+	"phone_number",
+	"email",
+	"address",
+	"driver",
+	"service",
+	"variation",
+]
+
+ORDER_ITEM_FIELDS = ["parent", "item_code", "item_name", "qty", "rate", "amount"]
+
+
+def _get_map(doctype, names, fields):
+	names = list({str(n) for n in names if n})
+	if not names:
+		return {}
+
+	rows = frappe.get_all(doctype, filters={"name": ["in", names]}, fields=["name", *fields])
+	return {str(r.name): r for r in rows}
+
+
+def load_orders(order_names):
+	# orders with their `services` rows, in the order the names were given
+	order_names = [str(n) for n in order_names]
+	if not order_names:
+		return []
+
+	orders = {
+		str(o.name): o
+		for o in frappe.get_all("Order", filters={"name": ["in", order_names]}, fields=ORDER_VIEW_FIELDS)
+	}
+
+	for o in orders.values():
+		o.services = []
+	for row in frappe.get_all(
+		"Sales Invoice Item",
+		filters={"parent": ["in", list(orders)], "parenttype": "Order", "parentfield": "services"},
+		fields=ORDER_ITEM_FIELDS,
+		order_by="idx asc",
+	):
+		orders[row.parent].services.append(row)
+
+	return [orders[name] for name in order_names if name in orders]
+
+
+def get_order_context(orders):
+	addresses = _get_map(
+		"Customer Address", (o.address for o in orders), ["address", "lat_lng", "state", "region"]
+	)
+	drivers = _get_map("Drivers", (o.driver for o in orders), ["driver_name", "user"])
+	users = _get_map("User", (d.user for d in drivers.values()), ["mobile_no"])
+	customers = _get_map("Customer", (o.customer for o in orders), ["customer_name", "custom_user"])
+
+	item_names = {o.service for o in orders if o.service}
+	for o in orders:
+		item_names.update(row.item_code for row in (o.services or []) if row.item_code)
+	items = _get_map("Item", item_names, ["item_name", "custom_item_name_ar", "image"])
+
+	reviews = {}
+	if customers and items:
+		for review in frappe.get_all(
+			"Reviews",
+			filters={"customer": ["in", list(customers)], "service": ["in", list(items)]},
+			fields=[
+				"name",
+				"customer",
+				"service",
+				"stars",
+				"review",
+				"creation",
+				"likes_count",
+				"dislikes_count",
+			],
+			order_by="modified desc",
+		):
+			reviews.setdefault((review.customer, review.service), review)
+
+	return frappe._dict(
+		addresses=addresses,
+		drivers=drivers,
+		driver_contacts={name: users.get(str(d.user), {}).get("mobile_no") for name, d in drivers.items()},
+		customers=customers,
+		items=items,
+		reviews=reviews,
+	)
+
+
+def get_order_review(context, customer_id, product_id):
+	review = context.reviews.get((customer_id, product_id))
+	if not review:
+		return None
+
+	return {
+		"id": int(review.name),
+		"product_id": product_id,
+		"user_id": customer_id,
+		"rating": review.stars,
+		"review_likes": review.likes_count or 0,
+		"review_dislikes": review.dislikes_count or 0,
+		"is_user_like": 0,
+		"is_user_dislike": 0,
+		"review_msg": review.review,
+		"user_name": (context.customers.get(customer_id) or {}).get("customer_name"),
+		"created_at": str(review.creation),
+	}
+
+
+def build_order_views(order_names, build_response, base_url=None):
+	base_url = base_url or frappe.utils.get_url()
+	orders = load_orders(order_names)
+	context = get_order_context(orders)
+	return [build_response(o, base_url, context) for o in orders]
@@ -0,0 +1,87 @@
+import base64
+import json
+
+import frappe
+from frappe import _
+from frappe.utils import cint, getdate, make_filter_tuple
+
+DEFAULT_PAGE_LENGTH = 20
+MAX_PAGE_LENGTH = 100
+
+
+def is_paged(limit=None, cursor=None):
+	return bool(cint(limit) or cursor)
+
+
+def get_page_length(limit=None):
+	limit = cint(limit) or DEFAULT_PAGE_LENGTH
+	return max(1, min(limit, MAX_PAGE_LENGTH))
+
+
+def get_date_filter(from_date=None, to_date=None):
+	if from_date and to_date:
+		return ["between", [getdate(from_date), getdate(to_date)]]
+	if from_date:
+		return [">=", getdate(from_date)]
+	if to_date:
+		return ["<=", getdate(to_date)]
+	return None
+
+
+def encode_cursor(row, sort_field="modified"):
+	payload = json.dumps([str(row.get(sort_field)), row.name])
+	return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor):
+	try:
+		value, name = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+	except Exception:
+		frappe.throw(_("Invalid cursor"))
+	return value, name
+
+
+def _filter_list(doctype, filters):
+	# list-form filters are ANDed, so the keyset conditions cannot replace a caller's filter on the same field
+	if isinstance(filters, dict):
+		return [make_filter_tuple(doctype, key, value) for key, value in filters.items()]
+	return [list(f) for f in filters or []]
+
+
+def get_page(
+	doctype, filters=None, or_filters=None, fields=None, limit=None, cursor=None, sort_field="modified"
+):
+	# keyset page ordered by `<sort_field> desc, name desc`: rows sharing the cursor's
+	# sort value are read first, then older rows, so both queries stay bounded
+	page_length = get_page_length(limit)
+	filters = _filter_list(doctype, filters)
+	fields = list(fields or ["name"])
+	for field in ("name", sort_field):
+		if field not in fields:
+			fields.append(field)
+
+	rows = []
+	if cursor:
+		value, name = decode_cursor(cursor)
+		rows = frappe.get_all(
+			doctype,
+			filters=[*filters, [doctype, sort_field, "=", value], [doctype, "name", "<", name]],
+			or_filters=or_filters,
+			fields=fields,
+			order_by="name desc",
+			limit=page_length + 1,
+		)
+		filters.append([doctype, sort_field, "<", value])
+
+	if len(rows) <= page_length:
+		rows += frappe.get_all(
+			doctype,
+			filters=filters,
+			or_filters=or_filters,
+			fields=fields,
+			order_by=f"{sort_field} desc, name desc",
+			limit=page_length + 1 - len(rows),
+		)
+
+	next_cursor = encode_cursor(rows[page_length - 1], sort_field) if len(rows) > page_length else None
+	return rows[:page_length], next_cursor
@@ -0,0 +1,137 @@
+import json
+from datetime import timedelta
+
+import frappe
+from frappe.utils import get_timedelta
+
+from fds_app.utils.reference import get_reference_map, get_variation_and_unit
+
+PROJECTION_FIELD = "custom_catalog_projection"
+
+
+def _format_time(value):
+	# rows read from the database carry timedelta, rows on a document being saved may carry "HH:MM:SS"
+	if not value:
+		return None
+	return str(value if isinstance(value, timedelta) else get_timedelta(str(value)) or value)
+
+
+def build_catalog_projection(rows):
+	variation_data = []
+	prices = []
+	unit_name_en = None
+	unit_name_ar = None
+
+	for row in rows:
+		variation, unit = get_variation_and_unit(row.variation)
+		variation_data.append(
+			{
+				"variation_id": variation.name,
+				"variation_name_en": variation.name_en,
+				"variation_name_ar": variation.name_ar,
+				"from_time": _format_time(row.get("from")),
+				"to_time": _format_time(row.get("to")),
+				"max_per_day": row.max_per_day,
+				"price": row.price,
+			}
+		)
+		prices.append(row.price)
+		if not unit_name_en:
+			unit_name_en = unit.name_en
+			unit_name_ar = unit.name_ar
+
+	return {
+		"variation_data": variation_data,
+		"min_price": min(prices) if prices else 0,
+		"max_price": max(prices) if prices else 0,
+		"unit_name_en": unit_name_en,
+		"unit_name_ar": unit_name_ar,
+	}
+
+
+def _get_slot_rows(item_names):
+	rows = frappe.db.sql(
+		"""SELECT parent, variation, `from`, `to`, max_per_day, price
+		FROM `tabSlots Variations Table`
+		WHERE parenttype = 'Item'
+			AND parentfield = 'custom_slots_and_variations_table'
+			AND parent IN %(items)s
+		ORDER BY parent, idx""",
+		{"items": tuple(item_names)},
+		as_dict=True,
+	)
+
+	item_rows = {}
+	for row in rows:
+		item_rows.setdefault(row.parent, []).append(row)
+	return item_rows
+
+
+def compute_catalog_projections(item_names):
+	item_names = list({i for i in item_names if i})
+	if not item_names:
+		return {}
+
+	item_rows = _get_slot_rows(item_names)
+	return {item: build_catalog_projection(item_rows.get(item, [])) for item in item_names}
+
+
+def get_catalog_projections(items):
+	projections = {}
+	missing = []
+	for item in items:
+		value = item.get(PROJECTION_FIELD)
+		if value:
+			projections[item.name] = json.loads(value) if isinstance(value, str) else value
+		else:
+			missing.append(item.name)
+
+	# items saved before the projection existed are computed on the fly until the backfill reaches them
+	projections.update(compute_catalog_projections(missing))
+	return projections
+
+
+def set_catalog_projection(doc, method=None):
+	doc.set(
+		PROJECTION_FIELD,
+		frappe.as_json(
+			build_catalog_projection(doc.get("custom_slots_and_variations_table") or []),
+			indent=None,
+			separators=(",", ":"),
+		),
+	)
+
+
+def refresh_catalog_projections(item_names):
+	for item, projection in compute_catalog_projections(item_names).items():
+		frappe.db.set_value(
+			"Item",
+			item,
+			PROJECTION_FIELD,
+			frappe.as_json(projection, indent=None, separators=(",", ":")),
+			update_modified=False,
+		)
+
+
+def refresh_projections_for_reference(doc, method=None, *args):
+	if doc.doctype == "Variations":
+		variations = [str(doc.name)]
+	else:
+		variations = [
+			name for name, v in get_reference_map("Variations").items() if str(v.unit) == str(doc.name)
+		]
+	if not variations:
+		return
+
+	items = frappe.get_all(
+		"Slots Variations Table",
+		filters={"parenttype": "Item", "variation": ["in", variations]},
+		pluck="parent",
+		distinct=True,
+	)
+	if items:
+		frappe.enqueue(
+			"fds_app.utils.projection.refresh_catalog_projections",
+			item_names=items,
+			enqueue_after_commit=True,
+		)
@@ -0,0 +1,87 @@
+import frappe
+
+REFERENCE_FIELDS = {
+	"Variations": ["name", "name_en", "name_ar", "unit"],
+	"Units": ["name", "name_en", "name_ar"],
+	"Brand": ["name", "brand"],
+	"Region": ["name", "name_en", "name_ar", "disable"],
+	"State": ["name", "name_en", "name_ar", "region", "disable"],
+}
+
+CACHE_EXPIRY = 24 * 60 * 60
+
+# process-wide tier: (site, doctype) -> (version, records); the version lives in redis
+# so every worker drops its copy as soon as one of them invalidates the doctype
+_process_cache = {}
+
+
+def _version_key(doctype):
+	return f"fds_app:reference:{doctype}:version"
+
+
+def _records_key(doctype, version):
+	return f"fds_app:reference:{doctype}:{version}"
+
+
+def _load_records(doctype):
+	return {str(r.name): r for r in frappe.get_all(doctype, fields=REFERENCE_FIELDS[doctype])}
+
+
+def _get_version(doctype):
+	version = frappe.cache().get_value(_version_key(doctype))
+	if not version:
+		version = frappe.generate_hash(length=10)
+		frappe.cache().set_value(_version_key(doctype), version)
+	return version
+
+
+def get_reference_map(doctype):
+	request_cache = getattr(frappe.local, "fds_reference_cache", None)
+	if request_cache is None:
+		request_cache = frappe.local.fds_reference_cache = {}
+	if doctype in request_cache:
+		return request_cache[doctype]
+
+	version = _get_version(doctype)
+	local_key = (frappe.local.site, doctype)
+	entry = _process_cache.get(local_key)
+
+	if not entry or entry[0] != version:
+		records = frappe.cache().get_value(_records_key(doctype, version))
+		if records is None:
+			records = _load_records(doctype)
+			frappe.cache().set_value(_records_key(doctype, version), records, expires_in_sec=CACHE_EXPIRY)
+		entry = (version, records)
+		_process_cache[local_key] = entry
+
+	request_cache[doctype] = entry[1]
+	return entry[1]
+
+
+def get_reference(doctype, name):
+	if not name:
+		return frappe._dict()
+	return get_reference_map(doctype).get(str(name)) or frappe._dict()
+
+
+def get_variation_and_unit(variation):
+	variation_doc = get_reference("Variations", variation)
+	return variation_doc, get_reference("Units", variation_doc.unit)
+
+
+def _bump_version(doctype):
+	frappe.cache().set_value(_version_key(doctype), frappe.generate_hash(length=10))
+	_process_cache.pop((frappe.local.site, doctype), None)
+	request_cache = getattr(frappe.local, "fds_reference_cache", None)
+	if request_cache:
+		request_cache.pop(doctype, None)
+
+
+def clear_reference_cache(doc, method=None, *args):
+	doctype = doc.doctype
+	if doctype not in REFERENCE_FIELDS:
+		return
+
+	_bump_version(doctype)
+	# bump again once the change is visible, so no worker keeps a copy read mid-transaction
+	frappe.db.after_commit.add(lambda: _bump_version(doctype))
@@ -0,0 +1,65 @@
+import re
+
+from frappe.utils import strip_html_tags
+
+# harakat, quranic marks and tatweel
+ARABIC_DIACRITICS = re.compile("[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]")
+
+ARABIC_FOLDING = str.maketrans(
+	{
+		"\u0623": "\u0627",  # alef with hamza above
+		"\u0625": "\u0627",  # alef with hamza below
+		"\u0622": "\u0627",  # alef with madda
+		"\u0671": "\u0627",  # alef wasla
+		"\u0649": "\u064a",  # alef maksura -> ya
+		"\u06cc": "\u064a",  # farsi ya
+		"\u0629": "\u0647",  # ta marbuta -> ha
+		"\u0624": "\u0648",  # waw with hamza
+		"\u0626": "\u064a",  # ya with hamza
+		"\u06a9": "\u0643",  # keheh -> kaf
+		**{chr(0x0660 + i): str(i) for i in range(10)},
+		**{chr(0x06F0 + i): str(i) for i in range(10)},
+	}
+)
+
+ARABIC_ARTICLES = ("وال", "بال", "كال", "فال", "لل", "ال")
+
+TOKEN_SPLIT = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_text(text):
+	if not text:
+		return ""
+	text = strip_html_tags(str(text)).lower()
+	text = ARABIC_DIACRITICS.sub("", text).translate(ARABIC_FOLDING)
+	return " ".join(TOKEN_SPLIT.split(text)).strip()
+
+
+def strip_article(token):
+	for article in ARABIC_ARTICLES:
+		if token.startswith(article) and len(token) - len(article) >= 2:
+			return token[len(article) :]
+	return token
+
+
+def tokenize(text):
+	tokens = []
+	for token in normalize_text(text).split():
+		token = token.strip("_")
+		if token and token not in tokens:
+			tokens.append(token)
+	return tokens
+
+
+def index_tokens(*texts):
+	tokens = []
+	for text in texts:
+		for token in tokenize(text):
+			for variant in (token, strip_article(token)):
+				if variant not in tokens:
+					tokens.append(variant)
+	return tokens
+
+
+def query_tokens(query):
+	return [strip_article(token) for token in tokenize(query)]
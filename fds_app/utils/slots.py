@@ -0,0 +1,120 @@
+from datetime import datetime
+
+import frappe
+from frappe import _
+from frappe.utils import add_days, date_diff, get_time, getdate
+
+from fds_app.utils.holidays import is_holiday
+
+MAX_RANGE_DAYS = 31
+
+
+def get_slot_rows(service, variation):
+	return frappe.db.sql(
+		"""SELECT `from` AS time_from, `to` AS time_to, max_per_day, price, time_ampm
+		FROM `tabSlots Variations Table`
+		WHERE parenttype = 'Item'
+			AND parentfield = 'custom_slots_and_variations_table'
+			AND parent = %(service)s
+			AND variation = %(variation)s
+		ORDER BY idx""",
+		{"service": service, "variation": str(variation)},
+		as_dict=True,
+	)
+
+
+def slot_key(time_from, time_to):
+	return f"{time_from} - {time_to}"
+
+
+def normalize_time(value):
+	if value in (None, ""):
+		return None
+	return get_time(value).strftime("%H:%M:%S")
+
+
+def parse_slot_label(label):
+	# Order.data_lnrd holds either "HH:MM:SS - HH:MM:SS" or the "H:MM AM : H:MM PM" label
+	if not label:
+		return None, None
+
+	try:
+		if " - " in label:
+			time_from, time_to = label.split(" - ", 1)
+			return normalize_time(time_from.strip()), normalize_time(time_to.strip())
+		if " : " in label:
+			time_from, time_to = label.split(" : ", 1)
+			return (
+				datetime.strptime(time_from.strip(), "%I:%M %p").strftime("%H:%M:%S"),
+				datetime.strptime(time_to.strip(), "%I:%M %p").strftime("%H:%M:%S"),
+			)
+	except Exception:
+		pass
+
+	return None, None
+
+
+def get_booked_counts(service, variation, from_date, to_date):
+	rows = frappe.db.sql(
+		"""SELECT order_date, slot_from, slot_to, COUNT(*) AS booked
+		FROM `tabOrder`
+		WHERE service = %(service)s
+			AND variation = %(variation)s
+			AND order_date BETWEEN %(from_date)s AND %(to_date)s
+			AND IFNULL(status, '') != 'cancelled'
+		GROUP BY order_date, slot_from, slot_to""",
+		{
+			"service": service,
+			"variation": str(variation),
+			"from_date": from_date,
+			"to_date": to_date,
+		},
+		as_dict=True,
+	)
+
+	return {
+		(str(r.order_date), normalize_time(r.slot_from), normalize_time(r.slot_to)): r.booked for r in rows
+	}
+
+
+def get_slot_availability(service, variation, from_date, to_date=None, holiday_list=None):
+	from_date = getdate(from_date)
+	to_date = getdate(to_date or from_date)
+	if date_diff(to_date, from_date) < 0:
+		frappe.throw(_("to_date must not be before from_date"))
+	if date_diff(to_date, from_date) >= MAX_RANGE_DAYS:
+		frappe.throw(_("Date range cannot exceed {0} days").format(MAX_RANGE_DAYS))
+
+	slot_rows = get_slot_rows(service, variation)
+	if not slot_rows:
+		return {}
+
+	booked_counts = get_booked_counts(service, variation, from_date, to_date)
+
+	availability = {}
+	for offset in range(date_diff(to_date, from_date) + 1):
+		day = str(add_days(from_date, offset))
+		if is_holiday(holiday_list, day):
+			availability[day] = None
+			continue
+
+		slots = []
+		for row in slot_rows:
+			time_from = str(row.time_from) if row.time_from is not None else None
+			time_to = str(row.time_to) if row.time_to is not None else None
+			max_per_day = row.max_per_day or 0
+			booked = booked_counts.get((day, normalize_time(row.time_from), normalize_time(row.time_to)), 0)
+			slots.append(
+				frappe._dict(
+					time_from=time_from,
+					time_to=time_to,
+					label=row.time_ampm,
+					price=row.price or 0,
+					max_per_day=max_per_day,
+					booked=booked,
+					remaining=max_per_day - booked,
+				)
+			)
+		availability[day] = slots
+
+	return availability
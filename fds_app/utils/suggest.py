@@ -0,0 +1,118 @@
+from bisect import bisect_left
+
+import frappe
+from frappe.utils import cint
+
+from fds_app.utils.search import index_tokens, normalize_text, query_tokens
+
+VERSION_KEY = "fds_app:suggest:version"
+CACHE_EXPIRY = 24 * 60 * 60
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 20
+
+ITEM_SUGGEST_FIELDS = ("item_name", "custom_item_name_ar", "image", "disabled", "custom_is_business")
+CATEGORY_SUGGEST_FIELDS = ("custom_name_ar", "image")
+
+# process-wide tier: site -> (version, index), same scheme as utils.reference
+_process_cache = {}
+
+
+def _index_key(version):
+	return f"fds_app:suggest:{version}"
+
+
+def _get_version():
+	version = frappe.cache().get_value(VERSION_KEY)
+	if not version:
+		version = frappe.generate_hash(length=10)
+		frappe.cache().set_value(VERSION_KEY, version)
+	return version
+
+
+def _build_index():
+	entries = []
+	for c in frappe.get_all("Item Group", fields=["name", "custom_name_ar", "image"]):
+		entries.append(("category", c.name, c.name, c.custom_name_ar, c.image))
+	for i in frappe.get_all(
+		"Item",
+		filters={"disabled": 0, "custom_is_business": 0},
+		fields=["name", "item_name", "custom_item_name_ar", "image"],
+	):
+		entries.append(("item", i.name, i.item_name, i.custom_item_name_ar, i.image))
+
+	# sorted (token, entry) pairs: every entry sharing a prefix sits in one contiguous run
+	pairs = sorted(
+		(token, position)
+		for position, entry in enumerate(entries)
+		for token in index_tokens(entry[2], entry[3])
+	)
+
+	return frappe._dict(
+		tokens=[p[0] for p in pairs],
+		positions=[p[1] for p in pairs],
+		names=[(normalize_text(e[2]), normalize_text(e[3])) for e in entries],
+		entries=entries,
+	)
+
+
+def get_suggest_index():
+	version = _get_version()
+	entry = _process_cache.get(frappe.local.site)
+	if entry and entry[0] == version:
+		return entry[1]
+
+	index = frappe.cache().get_value(_index_key(version))
+	if index is None:
+		index = _build_index()
+		frappe.cache().set_value(_index_key(version), index, expires_in_sec=CACHE_EXPIRY)
+
+	_process_cache[frappe.local.site] = (version, index)
+	return index
+
+
+def _prefix_matches(index, prefix):
+	matches = set()
+	position = bisect_left(index.tokens, prefix)
+	while position < len(index.tokens) and index.tokens[position].startswith(prefix):
+		matches.add(index.positions[position])
+		position += 1
+	return matches
+
+
+def get_suggestions(query, limit=None):
+	tokens = query_tokens(query)
+	if not tokens:
+		return []
+
+	index = get_suggest_index()
+	matches = None
+	for token in sorted(tokens, key=len, reverse=True):
+		found = _prefix_matches(index, token)
+		matches = found if matches is None else matches & found
+		if not matches:
+			return []
+
+	normalized_query = normalize_text(query)
+
+	def rank(position):
+		entry_type, name, name_en, name_ar, _image = index.entries[position]
+		starts = any(n.startswith(normalized_query) for n in index.names[position] if n)
+		return (not starts, entry_type != "category", len(name_en or name_ar or ""), name)
+
+	limit = max(1, min(cint(limit) or DEFAULT_LIMIT, MAX_LIMIT))
+	return [index.entries[p] for p in sorted(matches, key=rank)[:limit]]
+
+
+def _bump_version():
+	frappe.cache().set_value(VERSION_KEY, frappe.generate_hash(length=10))
+	_process_cache.pop(frappe.local.site, None)
+
+
+def clear_suggest_index(doc, method=None, *args):
+	if method == "on_update":
+		fields = ITEM_SUGGEST_FIELDS if doc.doctype == "Item" else CATEGORY_SUGGEST_FIELDS
+		if not any(doc.has_value_changed(field) for field in fields):
+			return
+
+	_bump_version()
+	frappe.db.after_commit.add(_bump_version)
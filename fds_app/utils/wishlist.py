@@ -0,0 +1,81 @@
+import frappe
+
+CACHE_KEY = "fds_app:wishlist"
+
+WISHLIST_FILTERS = {
+	"parenttype": "Customer",
+	"parentfield": "custom_wishlist_items",
+}
+
+
+def _load_wishlist(customer):
+	return frappe.get_all("Item Table", filters={**WISHLIST_FILTERS, "parent": customer}, pluck="item")
+
+
+def get_wishlist_set(customer):
+	if not customer:
+		return frozenset()
+
+	request_cache = getattr(frappe.local, "fds_wishlist", None)
+	if request_cache is None:
+		request_cache = frappe.local.fds_wishlist = {}
+	if customer in request_cache:
+		return request_cache[customer]
+
+	items = frappe.cache().hget(CACHE_KEY, customer, generator=lambda: _load_wishlist(customer))
+	request_cache[customer] = frozenset(items or [])
+	return request_cache[customer]
+
+
+def is_in_wishlist(customer, item):
+	return item in get_wishlist_set(customer)
+
+
+def add_wishlist_item(customer, item):
+	filters = {**WISHLIST_FILTERS, "parent": customer, "item": item}
+	if frappe.db.exists("Item Table", filters):
+		return False
+
+	idx = frappe.db.sql(
+		"""SELECT IFNULL(MAX(idx), 0) + 1 FROM `tabItem Table`
+		WHERE parent = %(parent)s AND parenttype = %(parenttype)s AND parentfield = %(parentfield)s""",
+		filters,
+	)[0][0]
+
+	try:
+		frappe.get_doc({"doctype": "Item Table", **filters, "idx": idx}).db_insert()
+	except (frappe.DuplicateEntryError, frappe.UniqueValidationError):
+		# a concurrent tap inserted the same row first
+		return False
+	finally:
+		clear_wishlist_cache(customer)
+
+	return True
+
+
+def remove_wishlist_item(customer, item):
+	filters = {**WISHLIST_FILTERS, "parent": customer, "item": item}
+	if not frappe.db.exists("Item Table", filters):
+		return False
+
+	frappe.db.delete("Item Table", filters)
+	clear_wishlist_cache(customer)
+	return True
+
+
+def _drop_wishlist(customers):
+	request_cache = getattr(frappe.local, "fds_wishlist", None)
+	for customer in customers:
+		frappe.cache().hdel(CACHE_KEY, customer)
+		if request_cache:
+			request_cache.pop(customer, None)
+
+
+def clear_wishlist_cache(*customers):
+	customers = {c for c in customers if c}
+	_drop_wishlist(customers)
+	frappe.db.after_commit.add(lambda: _drop_wishlist(customers))
+
+
+def clear_customer_wishlist(doc, method=None, old_name=None, *args):
+	clear_wishlist_cache(doc.name, old_name)